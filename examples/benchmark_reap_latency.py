@@ -0,0 +1,48 @@
+import asyncio
+import statistics
+import sys
+import time
+
+from taskex.process import ChildProcess, ChildWatcher
+
+
+async def measure(children: int, watcher: ChildWatcher):
+    processes = [
+        await ChildProcess.create(
+            ["sleep", "60"],
+            stdout=None,
+            stderr=None,
+            watcher=watcher,
+        )
+        for _ in range(children)
+    ]
+
+    latencies: list[float] = []
+
+    for process in processes:
+        start = time.perf_counter()
+        process.kill()
+        await process.wait()
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+
+    return (
+        statistics.median(latencies) * 1000,
+        latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    )
+
+
+async def run():
+    watchers: list[ChildWatcher] = sys.argv[1:] or ["pidfd", "thread"]
+
+    for watcher in watchers:
+        for children in (10, 100, 1000):
+            median, p99 = await measure(children, watcher)
+            print(
+                f"{watcher:>6} - {children:>5} children - "
+                f"median: {median:.3f}ms - p99: {p99:.3f}ms"
+            )
+
+
+asyncio.run(run())
@@ -0,0 +1,37 @@
+import asyncio
+
+from taskex import Env, RunEvent, TaskRunner
+
+
+async def async_task(delay: float):
+    await asyncio.sleep(delay)
+    return delay
+
+
+def log_failure(event: RunEvent):
+    print(f"Run {event.token} failed")
+
+
+async def watch(runner: TaskRunner):
+    async for event in runner.subscribe(task_name="async_task"):
+        print(f"{event.token}: {event.previous_status.value} -> {event.status.value}")
+
+        if event.complete():
+            break
+
+
+async def run():
+    runner = TaskRunner(0, Env())
+
+    runner.add_listener(log_failure, statuses=["FAILED"])
+    watcher = asyncio.ensure_future(watch(runner))
+
+    run = runner.run(async_task, 1)
+
+    await runner.wait(run.token)
+    await watcher
+
+    await runner.shutdown()
+
+
+asyncio.run(run())
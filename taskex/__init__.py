@@ -1,4 +1,6 @@
 from .env import Env as Env
+from .executors import ExecutorPoolConfig as ExecutorPoolConfig
+from .models import RunEvent as RunEvent
 from .models import ShellProcess as ShellProcess
 from .task_runner import TaskRunner as TaskRunner
 from .util import TimeParser as TimeParser
\ No newline at end of file
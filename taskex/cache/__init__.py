@@ -0,0 +1 @@
+from .shell_cache import ShellCache as ShellCache
@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, Sequence
+
+from ..models import ShellProcess
+
+
+class ShellCache:
+    __slots__ = (
+        "_directory",
+        "_max_size",
+        "_digests",
+    )
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        max_size: int = 2**30,
+    ) -> None:
+        self._directory = pathlib.Path(directory)
+        self._max_size = max_size
+        self._digests: Dict[tuple[str, int, int], str] = {}
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def key(
+        self,
+        command: str,
+        args: Sequence[str] | None = None,
+        env: Dict[str, Any] | None = None,
+        cwd: str | None = None,
+        shell: bool = False,
+        executable: str | None = None,
+        inputs: Sequence[str | pathlib.Path] | None = None,
+    ) -> str:
+        base = pathlib.Path(cwd) if cwd else pathlib.Path.cwd()
+
+        fingerprint = json.dumps(
+            {
+                "command": command,
+                "args": list(args or ()),
+                "env": sorted((name, str(value)) for name, value in (env or {}).items()),
+                "cwd": str(base.resolve()),
+                "shell": shell,
+                "executable": executable,
+                "inputs": [
+                    self._hash_input(base / pathlib.Path(path)) for path in inputs or ()
+                ],
+            },
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[Dict[str, Any], bytes, bytes] | None:
+        path = self._directory / key
+
+        try:
+            with open(path, "rb") as entry:
+                header = json.loads(entry.readline())
+                stdout = entry.read(header["stdout"])
+                stderr = entry.read(header["stderr"])
+
+            os.utime(path)
+
+        except FileNotFoundError:
+            return None
+
+        except Exception:
+            path.unlink(missing_ok=True)
+            return None
+
+        return header["process"], stdout, stderr
+
+    def put(
+        self,
+        key: str,
+        process: ShellProcess,
+        stdout: bytes,
+        stderr: bytes,
+    ):
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        header = json.dumps(
+            {
+                "process": process.model_dump(
+                    mode="json",
+                    exclude={"result", "error", "cursor"},
+                ),
+                "stdout": len(stdout),
+                "stderr": len(stderr),
+            }
+        )
+
+        with tempfile.NamedTemporaryFile(
+            dir=self._directory,
+            prefix=".",
+            delete=False,
+        ) as entry:
+            entry.write(header.encode())
+            entry.write(b"\n")
+            entry.write(stdout)
+            entry.write(stderr)
+
+        os.replace(entry.name, self._directory / key)
+
+        self.evict()
+
+    def evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for path, entry_size, _ in entries:
+            if size <= self._max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entries(self):
+        try:
+            paths = list(os.scandir(self._directory))
+
+        except FileNotFoundError:
+            return []
+
+        entries: list[tuple[pathlib.Path, int, int]] = []
+        for path in paths:
+            if path.name.startswith("."):
+                continue
+
+            try:
+                stat = path.stat()
+                entries.append((pathlib.Path(path.path), stat.st_size, stat.st_mtime_ns))
+
+            except FileNotFoundError:
+                pass
+
+        return entries
+
+    def _hash_input(self, path: pathlib.Path):
+        if path.is_dir():
+            return [
+                self._hash_input(pathlib.Path(root) / name)
+                for root, _, names in sorted(os.walk(path))
+                for name in sorted(names)
+            ]
+
+        try:
+            stat = path.stat()
+
+        except FileNotFoundError:
+            return [str(path), None]
+
+        fingerprint = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(fingerprint)
+
+        if digest is None:
+            with open(path, "rb") as input_file:
+                digest = hashlib.file_digest(input_file, "sha256").hexdigest()
+
+            if len(self._digests) >= 4096:
+                self._digests.clear()
+
+            self._digests[fingerprint] = digest
+
+        return [str(path), digest]
@@ -1,7 +1,10 @@
+import json
 import os
-from typing import Callable, Dict, Literal, Union
+from typing import Callable, Dict, List, Literal, Union
 
-from pydantic import BaseModel, StrictInt, StrictStr
+from pydantic import BaseModel, StrictBool, StrictFloat, StrictInt, StrictStr
+
+from .executors import ExecutorPoolConfig
 
 PrimaryType = Union[str, int, float, bytes, bool]
 
@@ -11,11 +14,32 @@ class Env(BaseModel):
     MERCURY_SYNC_LOG_LEVEL: StrictStr = "info"
     MERCURY_SYNC_CLEANUP_INTERVAL: StrictStr = "1s"
     MERCURY_SYNC_TASK_RUNNER_MAX_THREADS: StrictInt = os.cpu_count()
+    MERCURY_SYNC_TASK_RUNNER_MIN_THREADS: StrictInt = 0
+    MERCURY_SYNC_EXECUTOR_SCALING: Literal["fixed", "elastic"] = "fixed"
+    MERCURY_SYNC_EXECUTOR_IDLE_TTL: StrictStr = "30s"
+    MERCURY_SYNC_EXECUTOR_POOLS: Dict[StrictStr, ExecutorPoolConfig] = {}
+    MERCURY_SYNC_EXECUTOR_PRELOAD: List[StrictStr] = []
+    MERCURY_SYNC_EXECUTOR_WARMUP: StrictBool = False
+    MERCURY_SYNC_EXECUTOR_START_METHOD: Literal["fork", "spawn", "forkserver"] | None = None
+    MERCURY_SYNC_EXECUTOR_FORKSERVER_PRELOAD: List[StrictStr] = []
+    MERCURY_SYNC_EXECUTOR_MAX_TASKS_PER_CHILD: StrictInt | None = None
+    MERCURY_SYNC_EXECUTOR_MAX_WORKER_RSS: StrictInt | None = None
     MERCURY_SYNC_MAX_RUNNING_WORKFLOWS: StrictInt = 1
     MERCURY_SYNC_MAX_PENDING_WORKFLOWS: StrictInt = 100
     MERCURY_SYNC_CONTEXT_POLL_RATE: StrictStr = "0.1s"
     MERCURY_SYNC_SHUTDOWN_POLL_RATE: StrictStr = "0.1s"
     MERCURY_SYNC_DUPLICATE_JOB_POLICY: Literal["reject", "replace"] = "replace"
+    MERCURY_SYNC_SHELL_BUFFER_SIZE: StrictInt = 2**16
+    MERCURY_SYNC_MAX_SHELL_PROCESSES: StrictInt | None = None
+    MERCURY_SYNC_SHELL_SPAWN_RATE: StrictInt | StrictFloat | None = None
+    MERCURY_SYNC_SHELL_SPAWN_BURST: StrictInt | None = None
+    MERCURY_SYNC_SHELL_KILL_GRACE_PERIOD: StrictStr = "5s"
+    MERCURY_SYNC_SHELL_SESSIONS: StrictInt = os.cpu_count()
+    MERCURY_SYNC_SHELL_SESSION_EXECUTABLE: StrictStr = "/bin/sh"
+    MERCURY_SYNC_SHELL_CACHE_DIRECTORY: StrictStr = os.path.join(
+        os.path.expanduser("~"), ".cache", "taskex"
+    )
+    MERCURY_SYNC_SHELL_CACHE_MAX_SIZE: StrictInt = 2**30
 
     @classmethod
     def types_map(self) -> Dict[str, Callable[[str], PrimaryType]]:
@@ -24,8 +48,27 @@ class Env(BaseModel):
             "MERCURY_SYNC_CLEANUP_INTERVAL": str,
             "MERCURY_SYNC_LOG_LEVEL": str,
             "MERCURY_SYNC_TASK_RUNNER_MAX_THREADS": int,
+            "MERCURY_SYNC_TASK_RUNNER_MIN_THREADS": int,
+            "MERCURY_SYNC_EXECUTOR_SCALING": str,
+            "MERCURY_SYNC_EXECUTOR_IDLE_TTL": str,
+            "MERCURY_SYNC_EXECUTOR_POOLS": json.loads,
+            "MERCURY_SYNC_EXECUTOR_PRELOAD": lambda value: value.split(","),
+            "MERCURY_SYNC_EXECUTOR_WARMUP": lambda value: value.lower() == "true",
+            "MERCURY_SYNC_EXECUTOR_START_METHOD": str,
+            "MERCURY_SYNC_EXECUTOR_FORKSERVER_PRELOAD": lambda value: value.split(","),
+            "MERCURY_SYNC_EXECUTOR_MAX_TASKS_PER_CHILD": int,
+            "MERCURY_SYNC_EXECUTOR_MAX_WORKER_RSS": int,
             "MERCURY_SYNC_MAX_WORKFLOWS": int,
             "MERCURY_SYNC_CONTEXT_POLL_RATE": str,
             "MERCURY_SYNC_SHUTDOWN_POLL_RATE": str,
             "MERCURY_SYNC_DUPLICATE_JOB_POLICY": str,
+            "MERCURY_SYNC_SHELL_BUFFER_SIZE": int,
+            "MERCURY_SYNC_MAX_SHELL_PROCESSES": int,
+            "MERCURY_SYNC_SHELL_SPAWN_RATE": float,
+            "MERCURY_SYNC_SHELL_SPAWN_BURST": int,
+            "MERCURY_SYNC_SHELL_KILL_GRACE_PERIOD": str,
+            "MERCURY_SYNC_SHELL_SESSIONS": int,
+            "MERCURY_SYNC_SHELL_SESSION_EXECUTABLE": str,
+            "MERCURY_SYNC_SHELL_CACHE_DIRECTORY": str,
+            "MERCURY_SYNC_SHELL_CACHE_MAX_SIZE": int,
         }
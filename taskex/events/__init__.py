@@ -0,0 +1,2 @@
+from .run_event_bus import RunEventBus as RunEventBus
+from .run_subscription import RunSubscription as RunSubscription
@@ -0,0 +1,67 @@
+import itertools
+import time
+from typing import Dict, Iterable
+
+from ..models import RunEvent, RunStatus, TaskType
+from ..models.run_status import RunStatusName
+
+from .run_subscription import RunEventCallback, RunSubscription
+
+
+class RunEventBus:
+    def __init__(self) -> None:
+        self._subscriptions: Dict[int, RunSubscription] = {}
+        self._subscription_ids = itertools.count()
+
+    @property
+    def active(self):
+        return len(self._subscriptions) > 0
+
+    def subscribe(
+        self,
+        task_name: str | None = None,
+        statuses: Iterable[RunStatus | RunStatusName] | None = None,
+        callback: RunEventCallback | None = None,
+    ):
+        subscription = RunSubscription(
+            next(self._subscription_ids),
+            task_name=task_name,
+            statuses=statuses,
+            callback=callback,
+        )
+
+        self._subscriptions[subscription.subscription_id] = subscription
+
+        return subscription
+
+    def unsubscribe(self, subscription_id: int):
+        self._subscriptions.pop(subscription_id, None)
+
+    def publish(
+        self,
+        run_id: int,
+        task_name: str,
+        status: RunStatus,
+        previous_status: RunStatus | None = None,
+        task_type: TaskType = TaskType.CALLABLE,
+    ):
+        if not self._subscriptions:
+            return
+
+        event: RunEvent | None = None
+
+        for subscription in list(self._subscriptions.values()):
+            if not subscription.matches(task_name, status):
+                continue
+
+            if event is None:
+                event = RunEvent(
+                    run_id=run_id,
+                    task_name=task_name,
+                    status=status,
+                    previous_status=previous_status,
+                    task_type=task_type,
+                    timestamp=time.monotonic(),
+                )
+
+            subscription.put(event)
@@ -0,0 +1,60 @@
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Iterable
+
+from ..models import RunEvent, RunStatus
+from ..models.run_status import RunStatusName
+
+RunEventCallback = Callable[[RunEvent], Awaitable[Any] | Any]
+
+
+class RunSubscription:
+    __slots__ = (
+        "subscription_id",
+        "task_name",
+        "statuses",
+        "callback",
+        "_queue",
+    )
+
+    def __init__(
+        self,
+        subscription_id: int,
+        task_name: str | None = None,
+        statuses: Iterable[RunStatus | RunStatusName] | None = None,
+        callback: RunEventCallback | None = None,
+    ) -> None:
+        self.subscription_id = subscription_id
+        self.task_name = task_name
+
+        self.statuses: set[RunStatus] | None = None
+        if statuses is not None:
+            self.statuses = set(RunStatus(status) for status in statuses)
+
+        self.callback = callback
+        self._queue: asyncio.Queue[RunEvent] | None = None
+
+        if callback is None:
+            self._queue = asyncio.Queue()
+
+    def matches(self, task_name: str, status: RunStatus):
+        if self.task_name is not None and self.task_name != task_name:
+            return False
+
+        return self.statuses is None or status in self.statuses
+
+    def put(self, event: RunEvent):
+        if self._queue is not None:
+            self._queue.put_nowait(event)
+            return
+
+        try:
+            result = self.callback(event)
+            if inspect.isawaitable(result):
+                asyncio.ensure_future(result)
+
+        except Exception:
+            pass
+
+    async def get(self) -> RunEvent:
+        return await self._queue.get()
@@ -0,0 +1,4 @@
+from .elastic_executor import ElasticExecutor as ElasticExecutor
+from .elastic_executor import ExecutorType as ExecutorType
+from .executor_pool import ExecutorPool as ExecutorPool
+from .executor_pool_config import ExecutorPoolConfig as ExecutorPoolConfig
@@ -0,0 +1,313 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, Deque, List, Literal, Tuple
+
+from .worker import measure_call
+
+ExecutorType = Literal["thread", "process"]
+
+
+class ElasticWorker:
+    __slots__ = (
+        "executor",
+        "idle_since",
+        "tasks",
+    )
+
+    def __init__(self, executor: ThreadPoolExecutor | ProcessPoolExecutor) -> None:
+        self.executor = executor
+        self.idle_since = time.monotonic()
+        self.tasks = 0
+
+
+class ElasticExecutor(Executor):
+    def __init__(
+        self,
+        executor_type: ExecutorType = "thread",
+        min_workers: int = 0,
+        max_workers: int = 1,
+        idle_ttl: int | float = 30,
+        max_tasks_per_child: int | None = None,
+        max_rss: int | None = None,
+        **worker_options: Any,
+    ) -> None:
+        self.executor_type = executor_type
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers, 1)
+        self.idle_ttl = idle_ttl
+
+        self.max_tasks_per_child: int | None = None
+        self.max_rss: int | None = None
+        if executor_type == "process":
+            self.max_tasks_per_child = max_tasks_per_child
+            self.max_rss = max_rss
+
+        self._retired = 0
+
+        self._worker_options = worker_options
+        self._lock = threading.Lock()
+        self._idle: List[ElasticWorker] = []
+        self._busy: set[ElasticWorker] = set()
+        self._queue: Deque[Tuple[Future, Callable[..., Any], tuple, dict]] = deque()
+        self._shutdown = False
+        self._stop_reaper = threading.Event()
+        self._reaper: threading.Thread | None = None
+
+        for _ in range(self.min_workers):
+            self._idle.append(self._create_worker())
+
+    @property
+    def size(self):
+        with self._lock:
+            return len(self._idle) + len(self._busy)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return len(self._busy)
+
+    @property
+    def retired(self):
+        with self._lock:
+            return self._retired
+
+    @property
+    def queued(self):
+        with self._lock:
+            return len(self._queue)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future = Future()
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            worker = self._checkout()
+            if worker is None:
+                self._queue.append((future, fn, args, kwargs))
+                return future
+
+        self._dispatch(worker, future, fn, args, kwargs)
+
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            workers = [*self._idle, *self._busy]
+            self._idle.clear()
+
+            queued: List[Future] = []
+            if cancel_futures:
+                queued = [future for future, _, _, _ in self._queue]
+                self._queue.clear()
+
+        self._stop_reaper.set()
+
+        for future in queued:
+            future.cancel()
+
+        for worker in workers:
+            worker.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _checkout(self) -> ElasticWorker | None:
+        if self._idle:
+            worker = self._idle.pop()
+
+        elif len(self._busy) < self.max_workers:
+            worker = self._create_worker()
+
+            if len(self._busy) + 1 > self.min_workers:
+                self._start_reaper()
+
+        else:
+            return None
+
+        self._busy.add(worker)
+        return worker
+
+    def _create_worker(self):
+        if self.executor_type == "process":
+            return ElasticWorker(
+                ProcessPoolExecutor(max_workers=1, **self._worker_options)
+            )
+
+        return ElasticWorker(ThreadPoolExecutor(max_workers=1, **self._worker_options))
+
+    def _dispatch(
+        self,
+        worker: ElasticWorker,
+        future: Future,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ):
+        while not future.set_running_or_notify_cancel():
+            with self._lock:
+                if not self._queue:
+                    self._release(worker)
+                    return
+
+                future, fn, args, kwargs = self._queue.popleft()
+
+        try:
+            inner = self._submit(worker, fn, args, kwargs)
+
+        except BrokenExecutor:
+            with self._lock:
+                worker = self._retire(worker, replace=True)
+
+            if worker is None:
+                future.set_exception(
+                    RuntimeError("cannot schedule new futures after shutdown")
+                )
+                return
+
+            try:
+                inner = self._submit(worker, fn, args, kwargs)
+
+            except Exception as err:
+                future.set_exception(err)
+
+                with self._lock:
+                    self._release(worker)
+
+                return
+
+        except Exception as err:
+            future.set_exception(err)
+
+            with self._lock:
+                self._release(worker)
+
+            return
+
+        inner.add_done_callback(
+            lambda completed: self._complete(worker, future, completed)
+        )
+
+    def _submit(
+        self,
+        worker: ElasticWorker,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ):
+        if self.max_rss:
+            return worker.executor.submit(measure_call, fn, args, kwargs)
+
+        return worker.executor.submit(fn, *args, **kwargs)
+
+    def _complete(self, worker: ElasticWorker, future: Future, completed: Future):
+        rss: int | None = None
+        broken = False
+
+        if completed.cancelled():
+            future.cancel()
+
+        elif error := completed.exception():
+            broken = isinstance(error, BrokenExecutor)
+            future.set_exception(error)
+
+        elif self.max_rss:
+            result, rss = completed.result()
+            future.set_result(result)
+
+        else:
+            future.set_result(completed.result())
+
+        worker.tasks += 1
+
+        with self._lock:
+            if broken or self._should_retire(worker, rss):
+                worker = self._retire(worker)
+
+                if worker is None:
+                    return
+
+            if self._shutdown or not self._queue:
+                self._release(worker)
+                return
+
+            future, fn, args, kwargs = self._queue.popleft()
+
+        self._dispatch(worker, future, fn, args, kwargs)
+
+    def _should_retire(self, worker: ElasticWorker, rss: int | None):
+        if self.max_tasks_per_child and worker.tasks >= self.max_tasks_per_child:
+            return True
+
+        return bool(self.max_rss and rss and rss > self.max_rss)
+
+    def _retire(
+        self,
+        worker: ElasticWorker,
+        replace: bool = False,
+    ) -> ElasticWorker | None:
+        self._busy.discard(worker)
+        self._retired += 1
+
+        worker.executor.shutdown(wait=False)
+
+        if self._shutdown:
+            return None
+
+        if (
+            replace
+            or self._queue
+            or len(self._idle) + len(self._busy) < self.min_workers
+        ):
+            replacement = self._create_worker()
+            self._busy.add(replacement)
+
+            return replacement
+
+        return None
+
+    def _release(self, worker: ElasticWorker):
+        self._busy.discard(worker)
+
+        if self._shutdown:
+            return
+
+        worker.idle_since = time.monotonic()
+        self._idle.append(worker)
+
+    def _start_reaper(self):
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = threading.Thread(
+                target=self._reap_idle,
+                name="taskex-elastic-reaper",
+                daemon=True,
+            )
+
+            self._reaper.start()
+
+    def _reap_idle(self):
+        while not self._stop_reaper.wait(max(self.idle_ttl / 2, 0.01)):
+            expired: List[ElasticWorker] = []
+
+            with self._lock:
+                deadline = time.monotonic() - self.idle_ttl
+                excess = len(self._idle) + len(self._busy) - self.min_workers
+
+                for worker in list(self._idle):
+                    if excess <= 0:
+                        break
+
+                    if worker.idle_since <= deadline:
+                        self._idle.remove(worker)
+                        expired.append(worker)
+                        excess -= 1
+
+            for worker in expired:
+                worker.executor.shutdown(wait=False)
@@ -0,0 +1,111 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable
+
+from ..util.time_parser import TimeParser
+from .elastic_executor import ElasticExecutor
+from .executor_pool_config import ExecutorPoolConfig
+from .worker import initialize_worker, warm_up_worker
+
+
+class ExecutorPool:
+    def __init__(
+        self,
+        name: str,
+        config: ExecutorPoolConfig,
+    ) -> None:
+        self.name = name
+        self.config = config
+
+        worker_options: Dict[str, Any] = {}
+        if config.preload or config.initializer:
+            worker_options.update(
+                initializer=initialize_worker,
+                initargs=(
+                    tuple(config.preload),
+                    config.initializer,
+                    config.initargs,
+                ),
+            )
+
+        if config.type == "process" and config.start_method:
+            worker_options["mp_context"] = multiprocessing.get_context(
+                config.start_method
+            )
+
+        recycle = config.type == "process" and bool(
+            config.max_tasks_per_child or config.max_rss
+        )
+
+        self.executor: ThreadPoolExecutor | ProcessPoolExecutor | ElasticExecutor
+        if config.scaling == "elastic" or recycle:
+            self.executor = ElasticExecutor(
+                executor_type=config.type,
+                min_workers=(
+                    config.min_workers
+                    if config.scaling == "elastic"
+                    else config.max_workers
+                ),
+                max_workers=config.max_workers,
+                idle_ttl=TimeParser(config.idle_ttl).time,
+                max_tasks_per_child=config.max_tasks_per_child,
+                max_rss=config.max_rss,
+                **worker_options,
+            )
+
+        elif config.type == "thread":
+            self.executor = ThreadPoolExecutor(
+                max_workers=config.max_workers,
+                **worker_options,
+            )
+
+        else:
+            self.executor = ProcessPoolExecutor(
+                max_workers=config.max_workers,
+                **worker_options,
+            )
+
+        self.semaphore = asyncio.Semaphore(value=config.max_workers)
+
+    @staticmethod
+    def set_forkserver_preload(configs: Iterable[ExecutorPoolConfig]):
+        preload = {
+            module: None
+            for config in configs
+            if config.type == "process" and config.start_method == "forkserver"
+            for module in (*config.forkserver_preload, *config.preload)
+        }
+
+        if preload:
+            multiprocessing.get_context("forkserver").set_forkserver_preload(
+                list(preload)
+            )
+
+    @property
+    def size(self):
+        if isinstance(self.executor, ElasticExecutor):
+            return self.executor.size
+
+        return self.executor._max_workers
+
+    async def warm_up(self):
+        workers = self.config.max_workers
+        if isinstance(self.executor, ElasticExecutor):
+            workers = self.executor.min_workers
+
+        loop = asyncio.get_running_loop()
+
+        return await asyncio.gather(
+            *[
+                loop.run_in_executor(self.executor, warm_up_worker)
+                for _ in range(workers)
+            ]
+        )
+
+    def shutdown(self, cancel_futures: bool = True):
+        try:
+            self.executor.shutdown(cancel_futures=cancel_futures)
+
+        except Exception:
+            pass
@@ -0,0 +1,22 @@
+import os
+from typing import Any, Callable, List, Literal, Tuple
+
+from pydantic import BaseModel, StrictBool, StrictInt, StrictStr
+
+from .elastic_executor import ExecutorType
+
+
+class ExecutorPoolConfig(BaseModel):
+    type: ExecutorType = "thread"
+    max_workers: StrictInt = os.cpu_count()
+    min_workers: StrictInt = 0
+    scaling: Literal["fixed", "elastic"] = "fixed"
+    idle_ttl: StrictStr = "30s"
+    preload: List[StrictStr] = []
+    initializer: Callable[..., Any] | None = None
+    initargs: Tuple[Any, ...] = ()
+    warm_up: StrictBool = False
+    start_method: Literal["fork", "spawn", "forkserver"] | None = None
+    forkserver_preload: List[StrictStr] = []
+    max_tasks_per_child: StrictInt | None = None
+    max_rss: StrictInt | None = None
@@ -0,0 +1,39 @@
+import importlib
+import os
+import resource
+import sys
+from typing import Any, Callable, Sequence
+
+
+def initialize_worker(
+    preload: Sequence[str],
+    initializer: Callable[..., Any] | None,
+    initargs: Sequence[Any],
+):
+    for module in preload:
+        importlib.import_module(module)
+
+    if initializer:
+        initializer(*initargs)
+
+
+def warm_up_worker():
+    return os.getpid()
+
+
+def current_rss():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure_call(
+    fn: Callable[..., Any],
+    args: Sequence[Any],
+    kwargs: dict[str, Any],
+):
+    return fn(*args, **kwargs), current_rss()
@@ -1,3 +1,6 @@
+from .output_cursor import OutputCursor as OutputCursor
+from .resource_usage import ResourceUsage as ResourceUsage
+from .run_event import RunEvent as RunEvent
 from .run_status import RunStatus as RunStatus
 from .shell_process import ShellProcess as ShellProcess
 from .shell_process import CommandType as CommandType
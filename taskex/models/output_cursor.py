@@ -0,0 +1,6 @@
+from pydantic import BaseModel, StrictInt
+
+
+class OutputCursor(BaseModel):
+    stdout: StrictInt = 0
+    stderr: StrictInt = 0
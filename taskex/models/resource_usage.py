@@ -0,0 +1,25 @@
+import sys
+
+from pydantic import BaseModel, StrictFloat, StrictInt
+
+
+class ResourceUsage(BaseModel):
+    user_time: StrictInt | StrictFloat = 0
+    system_time: StrictInt | StrictFloat = 0
+    max_rss: StrictInt = 0
+    voluntary_context_switches: StrictInt = 0
+    involuntary_context_switches: StrictInt = 0
+
+    @classmethod
+    def from_rusage(cls, rusage):
+        max_rss = rusage.ru_maxrss
+        if sys.platform != "darwin":
+            max_rss *= 1024
+
+        return cls(
+            user_time=rusage.ru_utime,
+            system_time=rusage.ru_stime,
+            max_rss=max_rss,
+            voluntary_context_switches=rusage.ru_nvcsw,
+            involuntary_context_switches=rusage.ru_nivcsw,
+        )
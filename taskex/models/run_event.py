@@ -0,0 +1,22 @@
+import time
+
+from pydantic import BaseModel, Field, StrictFloat, StrictInt, StrictStr
+
+from .run_status import RunStatus
+from .task_type import TaskType
+
+
+class RunEvent(BaseModel):
+    run_id: StrictInt
+    task_name: StrictStr
+    status: RunStatus
+    previous_status: RunStatus | None = None
+    task_type: TaskType = TaskType.CALLABLE
+    timestamp: StrictInt | StrictFloat = Field(default_factory=time.monotonic)
+
+    @property
+    def token(self):
+        return f"{self.task_name}:{self.run_id}"
+
+    def complete(self):
+        return self.status in [RunStatus.COMPLETE, RunStatus.CANCELLED, RunStatus.FAILED]
@@ -1,12 +1,19 @@
 import time
 from pydantic import (
     BaseModel,
+    ConfigDict,
+    StrictBool,
     StrictInt,
     StrictFloat,
     StrictStr,
     StrictBytes,
+    field_serializer,
 )
 from typing import Literal, Any, Dict, Tuple
+from ..output import OutputView
+
+from .output_cursor import OutputCursor
+from .resource_usage import ResourceUsage
 from .run_status import RunStatus
 from .task_type import TaskType
 
@@ -15,23 +22,38 @@ CommandType = Literal['shell', 'subprocess']
 
 
 class ShellProcess(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     run_id: StrictInt
     task_name: StrictStr
-    process_id: StrictInt
+    process_id: StrictInt | None = None
     command: StrictStr
     status: RunStatus
     args: Tuple[str, ...] | None = None
     return_code: StrictInt | None = None
     env: Dict[str, Any] | None = None
     working_directory: StrictStr | None = None
+    stdout_path: StrictStr | None = None
+    stderr_path: StrictStr | None = None
     command_type: CommandType = 'subprocess'
-    error: StrictStr | StrictBytes | None = None
+    error: StrictStr | StrictBytes | OutputView | None = None
     trace: StrictStr | StrictBytes | None = None
     start: StrictInt | StrictFloat = time.monotonic()
     end: StrictInt | StrictFloat | None = None
     elapsed: StrictInt | StrictFloat = 0
-    result: StrictStr | StrictBytes | None = None
+    result: StrictStr | StrictBytes | OutputView | None = None
+    cursor: OutputCursor | None = None
+    truncated: StrictBool = False
+    usage: ResourceUsage | None = None
     task_type: TaskType = TaskType.SHELL
 
+    @field_serializer("error", "result")
+    def serialize_output(self, output: str | bytes | OutputView | None):
+        if isinstance(output, OutputView):
+            errors = "replace" if output.errors == "strict" else output.errors
+            return str(output.data, output.encoding, errors)
+
+        return output
+
     def complete(self):
         return self.status in [RunStatus.COMPLETE, RunStatus.CANCELLED, RunStatus.FAILED]
\ No newline at end of file
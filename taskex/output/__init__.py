@@ -0,0 +1,5 @@
+from .output_buffer import OutputBuffer as OutputBuffer
+from .output_stream import OutputStream as OutputStream
+from .output_view import OutputView as OutputView
+from .output_target import OutputTarget as OutputTarget
+from .output_retention import OutputRetention as OutputRetention
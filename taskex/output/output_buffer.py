@@ -0,0 +1,197 @@
+import asyncio
+import os
+import tempfile
+from typing import BinaryIO
+
+from .output_retention import OutputRetention
+from .output_view import OutputView
+
+
+class OutputBuffer:
+    __slots__ = (
+        "_data",
+        "_data_offset",
+        "_head",
+        "_head_limit",
+        "_tail_limit",
+        "_max_size",
+        "_file",
+        "_size",
+        "_spill_threshold",
+        "_closed",
+        "_waiters",
+    )
+
+    def __init__(
+        self,
+        spill_threshold: int | None = None,
+        max_size: int | None = None,
+        retention: OutputRetention = "tail",
+    ) -> None:
+        self._data = bytearray()
+        self._head = bytearray()
+        self._max_size = max_size
+        self._head_limit = 0
+        self._tail_limit = 0
+
+        if max_size is not None:
+            match retention:
+                case "head":
+                    self._head_limit = max_size
+
+                case "head+tail":
+                    self._head_limit = max_size // 2
+                    self._tail_limit = max_size - self._head_limit
+
+                case _:
+                    self._tail_limit = max_size
+
+        self._data_offset = self._head_limit
+        self._file: BinaryIO | None = None
+        self._size = 0
+        self._spill_threshold = spill_threshold
+        self._closed = False
+        self._waiters: list[asyncio.Future] = []
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def spilled(self):
+        return self._file is not None
+
+    @property
+    def bounded(self):
+        return self._max_size is not None
+
+    @property
+    def truncated(self):
+        return self.bounded and self._size > self._max_size
+
+    def write(self, chunk: bytes):
+        if self._closed:
+            return
+
+        if self.bounded:
+            self._write_bounded(chunk)
+
+        elif self._file:
+            self._file.write(chunk)
+
+        else:
+            self._data.extend(chunk)
+
+        self._size += len(chunk)
+
+        if (
+            self._file is None
+            and self._spill_threshold is not None
+            and not self.bounded
+            and self._size > self._spill_threshold
+        ):
+            self._spill()
+
+        self._wake_waiters()
+
+    def close(self):
+        if self.bounded:
+            self._compact(self._tail_limit)
+
+        self._closed = True
+        self._wake_waiters()
+
+    def read(self, since: int = 0) -> bytes:
+        if since >= self._size:
+            return b""
+
+        if self._file:
+            return os.pread(self._file.fileno(), self._size - since, since)
+
+        if self.bounded:
+            return self._read_bounded(since)
+
+        return bytes(self._data[since:])
+
+    def view(
+        self,
+        since: int = 0,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ) -> OutputView:
+        if self._file:
+            source = self._file
+
+        elif self._closed and not self.bounded:
+            source = self._data
+
+        else:
+            source = self.read(since=since)
+            since = 0
+
+        return OutputView(
+            source,
+            start=since,
+            end=self._size if self._file else None,
+            encoding=encoding,
+            errors=errors,
+        )
+
+    async def wait(self, since: int = 0):
+        if self._closed or self._size > since:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        await waiter
+
+    def _write_bounded(self, chunk: bytes):
+        head_room = self._head_limit - len(self._head)
+        if head_room > 0:
+            self._head.extend(chunk[:head_room])
+            chunk = chunk[head_room:]
+
+        if not chunk or self._tail_limit == 0:
+            return
+
+        self._data.extend(chunk)
+
+        if len(self._data) >= 2 * self._tail_limit:
+            self._compact(self._tail_limit)
+
+    def _read_bounded(self, since: int) -> bytes:
+        output = bytearray()
+
+        if since < len(self._head):
+            output.extend(self._head[since:])
+
+        tail_start = max(self._data_offset, self._size - self._tail_limit)
+        tail_index = max(since, tail_start) - self._data_offset
+
+        if tail_index < len(self._data):
+            output.extend(self._data[tail_index:])
+
+        return bytes(output)
+
+    def _compact(self, limit: int):
+        excess = len(self._data) - limit
+        if excess > 0:
+            del self._data[:excess]
+            self._data_offset += excess
+
+    def _spill(self):
+        self._file = tempfile.TemporaryFile(buffering=0)
+        self._file.write(self._data)
+        self._data = bytearray()
+
+    def _wake_waiters(self):
+        waiters, self._waiters = self._waiters, []
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
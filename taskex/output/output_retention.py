@@ -0,0 +1,3 @@
+from typing import Literal
+
+OutputRetention = Literal["head", "tail", "head+tail"]
@@ -0,0 +1,87 @@
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class OutputStream:
+    __slots__ = (
+        "_chunks",
+        "_pending",
+        "_max_pending",
+        "_size",
+        "_closed",
+        "_detached",
+        "_attached",
+        "_readable",
+        "_writable",
+    )
+
+    def __init__(self, max_pending: int = 2**16) -> None:
+        self._chunks: Deque[bytes] = deque()
+        self._pending = 0
+        self._max_pending = max_pending
+        self._size = 0
+        self._closed = False
+        self._detached = False
+        self._attached = False
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def attached(self):
+        return self._attached
+
+    async def write(self, chunk: bytes):
+        self._size += len(chunk)
+
+        if self._closed or self._detached:
+            return
+
+        self._chunks.append(chunk)
+        self._pending += len(chunk)
+        self._readable.set()
+
+        if self._pending >= self._max_pending:
+            self._writable.clear()
+
+        await self._writable.wait()
+
+    async def read(self) -> bytes:
+        while not self._chunks:
+            if self._closed or self._detached:
+                return b""
+
+            self._readable.clear()
+            await self._readable.wait()
+
+        chunk = self._chunks.popleft()
+        self._pending -= len(chunk)
+
+        if self._pending < self._max_pending:
+            self._writable.set()
+
+        return chunk
+
+    def close(self):
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
+
+    def attach(self):
+        self._attached = True
+
+    def detach(self):
+        self._detached = True
+        self._chunks.clear()
+        self._pending = 0
+        self._readable.set()
+        self._writable.set()
@@ -0,0 +1,4 @@
+import pathlib
+from typing import BinaryIO
+
+OutputTarget = str | pathlib.Path | int | BinaryIO | None
@@ -0,0 +1,77 @@
+import mmap
+from typing import BinaryIO
+
+
+class OutputView:
+    __slots__ = (
+        "_source",
+        "_start",
+        "_end",
+        "_data",
+        "encoding",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        source: BinaryIO | bytes | bytearray | memoryview,
+        start: int = 0,
+        end: int | None = None,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ) -> None:
+        self._source = source
+        self._start = start
+        self._end = end
+        self._data: memoryview | None = None
+        self.encoding = encoding
+        self.errors = errors
+
+        if end is None and not hasattr(source, "fileno"):
+            self._end = len(source)
+
+        self._end = max(self._start, self._end)
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __str__(self):
+        return self.text
+
+    def __bytes__(self):
+        return bytes(self.data)
+
+    @property
+    def data(self) -> memoryview:
+        if self._data is not None:
+            return self._data
+
+        if hasattr(self._source, "fileno"):
+            if self._end == 0:
+                source = memoryview(b"")
+
+            else:
+                source = memoryview(
+                    mmap.mmap(
+                        self._source.fileno(),
+                        self._end,
+                        access=mmap.ACCESS_READ,
+                    )
+                )
+
+        else:
+            source = memoryview(self._source)
+
+        self._data = source[self._start : self._end]
+
+        return self._data
+
+    @property
+    def text(self):
+        return str(self.data, self.encoding, self.errors)
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        if offset < 0 or length <= 0 or offset >= len(self):
+            return b""
+
+        return bytes(self.data[offset : offset + length])
@@ -0,0 +1,6 @@
+from .child_process import ChildProcess as ChildProcess
+from .child_process import ChildWatcher as ChildWatcher
+from .input_source import InputSource as InputSource
+from .launch_spec import LaunchSpec as LaunchSpec
+from .shell_session import ShellSession as ShellSession
+from .shell_session_pool import ShellSessionPool as ShellSessionPool
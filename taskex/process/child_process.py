@@ -0,0 +1,210 @@
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+from typing import Any, Dict, Literal, Sequence
+
+from ..models import ResourceUsage
+
+ChildWatcher = Literal["pidfd", "thread"]
+
+
+class ChildProcess:
+    __slots__ = (
+        "_popen",
+        "_loop",
+        "_exit",
+        "_pidfd",
+        "returncode",
+        "usage",
+        "stdin",
+        "stdout",
+        "stderr",
+    )
+
+    def __init__(
+        self,
+        popen: subprocess.Popen,
+        loop: asyncio.AbstractEventLoop,
+        stdin: asyncio.StreamWriter | None = None,
+        stdout: asyncio.StreamReader | None = None,
+        stderr: asyncio.StreamReader | None = None,
+    ) -> None:
+        self._popen = popen
+        self._loop = loop
+        self._exit: asyncio.Future[int] = loop.create_future()
+        self._pidfd: int | None = None
+
+        self.returncode: int | None = None
+        self.usage: ResourceUsage | None = None
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def pid(self):
+        return self._popen.pid
+
+    @classmethod
+    async def create(
+        cls,
+        args: str | Sequence[str],
+        executable: str | None = None,
+        shell: bool = False,
+        stdin: Any = None,
+        stdout: Any = subprocess.PIPE,
+        stderr: Any = subprocess.PIPE,
+        env: Dict[str, str] | None = None,
+        cwd: str | os.PathLike | None = None,
+        limit: int = 2**16,
+        start_new_session: bool = False,
+        watcher: ChildWatcher = "pidfd",
+    ):
+        loop = asyncio.get_running_loop()
+
+        popen = subprocess.Popen(
+            args,
+            executable=executable,
+            shell=shell,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            env=env,
+            cwd=cwd,
+            bufsize=0,
+            start_new_session=start_new_session,
+        )
+
+        try:
+            process = cls(
+                popen,
+                loop,
+                stdin=await cls._connect_write_pipe(loop, popen.stdin),
+                stdout=await cls._connect_pipe(loop, popen.stdout, limit),
+                stderr=await cls._connect_pipe(loop, popen.stderr, limit),
+            )
+
+        except BaseException:
+            popen.kill()
+            popen.wait()
+            raise
+
+        if watcher != "pidfd" or not process._watch_pidfd():
+            threading.Thread(
+                target=process._reap,
+                name=f"taskex-reaper-{popen.pid}",
+                daemon=True,
+            ).start()
+
+        return process
+
+    @staticmethod
+    async def _connect_pipe(
+        loop: asyncio.AbstractEventLoop,
+        pipe: Any,
+        limit: int,
+    ):
+        if pipe is None:
+            return None
+
+        reader = asyncio.StreamReader(limit=limit, loop=loop)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop),
+            pipe,
+        )
+
+        return reader
+
+    @staticmethod
+    async def _connect_write_pipe(
+        loop: asyncio.AbstractEventLoop,
+        pipe: Any,
+    ):
+        if pipe is None:
+            return None
+
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.streams.FlowControlMixin(loop=loop),
+            pipe,
+        )
+
+        return asyncio.StreamWriter(transport, protocol, None, loop)
+
+    async def wait(self) -> int:
+        return await asyncio.shield(self._exit)
+
+    def send_signal(self, sig: int):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    def _watch_pidfd(self):
+        if not hasattr(os, "pidfd_open"):
+            return False
+
+        try:
+            self._pidfd = os.pidfd_open(self.pid)
+            self._loop.add_reader(self._pidfd, self._reap_pidfd)
+
+        except (OSError, NotImplementedError):
+            if self._pidfd is not None:
+                os.close(self._pidfd)
+                self._pidfd = None
+
+            return False
+
+        return True
+
+    def _reap_pidfd(self):
+        try:
+            pid, status, rusage = os.wait4(self.pid, os.WNOHANG)
+            if pid == 0:
+                return
+
+            returncode = os.waitstatus_to_exitcode(status)
+
+        except ChildProcessError:
+            returncode = 255
+            rusage = None
+
+        self._loop.remove_reader(self._pidfd)
+        os.close(self._pidfd)
+        self._pidfd = None
+
+        self._set_exit(returncode, rusage)
+
+    def _reap(self):
+        rusage = None
+
+        if hasattr(os, "wait4"):
+            try:
+                _, status, rusage = os.wait4(self.pid, 0)
+                returncode = os.waitstatus_to_exitcode(status)
+
+            except ChildProcessError:
+                returncode = 255
+
+        else:
+            returncode = self._popen.wait()
+
+        try:
+            self._loop.call_soon_threadsafe(self._set_exit, returncode, rusage)
+
+        except RuntimeError:
+            pass
+
+    def _set_exit(self, returncode: int, rusage: Any):
+        self.returncode = returncode
+        self._popen.returncode = returncode
+
+        if rusage is not None:
+            self.usage = ResourceUsage.from_rusage(rusage)
+
+        if not self._exit.done():
+            self._exit.set_result(returncode)
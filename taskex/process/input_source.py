@@ -0,0 +1,14 @@
+import pathlib
+from typing import AsyncIterable, BinaryIO
+
+InputSource = (
+    bytes
+    | bytearray
+    | memoryview
+    | str
+    | pathlib.Path
+    | int
+    | BinaryIO
+    | AsyncIterable[bytes]
+    | None
+)
@@ -0,0 +1,94 @@
+import os
+import shutil
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+class LaunchSpec:
+    __slots__ = (
+        "command",
+        "_base_env",
+        "_inherit_env",
+        "_envs",
+        "_max_envs",
+        "_executable",
+        "_search_path",
+    )
+
+    def __init__(
+        self,
+        command: str,
+        base_env: Mapping[str, str] | None = None,
+        max_envs: int = 32,
+    ) -> None:
+        self.command = command
+        self._inherit_env = base_env is None
+        self._base_env = MappingProxyType(
+            dict(os.environ if base_env is None else base_env)
+        )
+        self._envs: dict[frozenset, Mapping[str, str]] = {}
+        self._max_envs = max_envs
+        self._executable: str | None = None
+        self._search_path: str | None = None
+
+    @property
+    def base_env(self):
+        if self._inherit_env:
+            self._refresh()
+
+        return self._base_env
+
+    def env(
+        self,
+        overrides: Mapping[str, Any] | None = None,
+    ) -> Mapping[str, str] | None:
+        if self._inherit_env:
+            if not overrides:
+                return None
+
+            self._refresh()
+
+        elif not overrides:
+            return self._base_env
+
+        key = frozenset((name, str(value)) for name, value in overrides.items())
+        env = self._envs.get(key)
+
+        if env is None:
+            merged = dict(self._base_env)
+            merged.update(key)
+            env = MappingProxyType(merged)
+
+            if len(self._envs) >= self._max_envs:
+                self._envs.pop(next(iter(self._envs)))
+
+            self._envs[key] = env
+
+        return env
+
+    def executable(self, env: Mapping[str, str] | None = None) -> str:
+        if env is None:
+            env = os.environ if self._inherit_env else self._base_env
+
+        search_path = env.get("PATH", os.defpath)
+
+        if self._executable is None or search_path != self._search_path:
+            self._executable = shutil.which(self.command, path=search_path)
+            self._search_path = search_path
+
+        return self._executable or self.command
+
+    def invalidate(self, base_env: Mapping[str, str] | None = None):
+        self._base_env = MappingProxyType(
+            dict(os.environ if base_env is None else base_env)
+        )
+        self._envs.clear()
+        self._executable = None
+        self._search_path = None
+
+    def _refresh(self):
+        current = dict(os.environ)
+
+        if current != self._base_env:
+            self._base_env = MappingProxyType(current)
+            self._envs.clear()
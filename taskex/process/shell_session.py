@@ -0,0 +1,125 @@
+import asyncio
+import itertools
+import os
+import signal
+import subprocess
+import uuid
+
+from ..output import OutputBuffer
+from .child_process import ChildProcess
+
+
+class ShellSession:
+    __slots__ = (
+        "_process",
+        "_buffer_size",
+        "_marker",
+        "_commands",
+        "_broken",
+    )
+
+    def __init__(
+        self,
+        process: ChildProcess,
+        buffer_size: int = 2**16,
+    ) -> None:
+        self._process = process
+        self._buffer_size = buffer_size
+        self._marker = f"__taskex_{uuid.uuid4().hex}"
+        self._commands = itertools.count()
+        self._broken = False
+
+    @classmethod
+    async def create(
+        cls,
+        executable: str = "/bin/sh",
+        buffer_size: int = 2**16,
+    ):
+        process = await ChildProcess.create(
+            [executable],
+            stdin=subprocess.PIPE,
+            limit=buffer_size,
+            start_new_session=True,
+        )
+
+        return cls(process, buffer_size=buffer_size)
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def alive(self):
+        return not self._broken and self._process.returncode is None
+
+    async def execute(
+        self,
+        command: str,
+        stdout: OutputBuffer,
+        stderr: OutputBuffer,
+        redirects: str = "",
+    ) -> int:
+        marker = f"{self._marker}_{next(self._commands)}"
+
+        script = (
+            f"( {command}\n) </dev/null {redirects}; __taskex_status=$?; "
+            f"printf '\\n%s:%d\\n' '{marker}' \"$__taskex_status\"; "
+            f"printf '\\n%s:%d\\n' '{marker}' \"$__taskex_status\" >&2\n"
+        )
+
+        try:
+            self._process.stdin.write(script.encode())
+            await self._process.stdin.drain()
+
+            status, _ = await asyncio.gather(
+                self._pump_until(self._process.stdout, stdout, marker),
+                self._pump_until(self._process.stderr, stderr, marker),
+            )
+
+            return int(status)
+
+        except BaseException:
+            self._broken = True
+            raise
+
+    def kill(self):
+        self._broken = True
+
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    async def _pump_until(
+        self,
+        stream: asyncio.StreamReader,
+        buffer: OutputBuffer,
+        marker: str,
+    ) -> bytes:
+        delimiter = f"\n{marker}:".encode()
+        pending = bytearray()
+
+        while (index := pending.find(delimiter)) < 0:
+            flushed = len(pending) - len(delimiter) + 1
+            if flushed > 0:
+                buffer.write(bytes(pending[:flushed]))
+                del pending[:flushed]
+
+            chunk = await stream.read(self._buffer_size)
+            if not chunk:
+                raise EOFError(f"Shell session {self.pid} exited mid-command.")
+
+            pending.extend(chunk)
+
+        buffer.write(bytes(pending[:index]))
+        status = pending[index + len(delimiter) :]
+
+        while b"\n" not in status:
+            chunk = await stream.read(self._buffer_size)
+            if not chunk:
+                raise EOFError(f"Shell session {self.pid} exited mid-command.")
+
+            status.extend(chunk)
+
+        return bytes(status.split(b"\n", maxsplit=1)[0])
@@ -0,0 +1,48 @@
+import asyncio
+from typing import List
+
+from .shell_session import ShellSession
+
+
+class ShellSessionPool:
+    def __init__(
+        self,
+        size: int,
+        executable: str = "/bin/sh",
+        buffer_size: int = 2**16,
+    ) -> None:
+        self.size = size
+        self._executable = executable
+        self._buffer_size = buffer_size
+        self._semaphore = asyncio.Semaphore(value=size)
+        self._idle: List[ShellSession] = []
+
+    async def acquire(self) -> ShellSession:
+        await self._semaphore.acquire()
+
+        while self._idle:
+            session = self._idle.pop()
+            if session.alive:
+                return session
+
+        try:
+            return await ShellSession.create(
+                executable=self._executable,
+                buffer_size=self._buffer_size,
+            )
+
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def release(self, session: ShellSession):
+        if session.alive:
+            self._idle.append(session)
+
+        self._semaphore.release()
+
+    def close(self):
+        for session in self._idle:
+            session.kill()
+
+        self._idle.clear()
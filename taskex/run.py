@@ -1,21 +1,54 @@
 import asyncio
+import codecs
 import functools
 import inspect
+import io
 import json
+import os
 import pathlib
+import shlex
+import signal
+import subprocess
 import time
 import traceback
-from asyncio.subprocess import Process
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from typing import Any, Awaitable, Callable, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Optional,
+    Sequence,
+)
 
+from .cache import ShellCache
+from .events import RunEventBus
+from .executors import ElasticExecutor
 from .models import (
     CommandType,
+    OutputCursor,
     RunStatus,
     ShellProcess,
     TaskRun,
     TaskType,
 )
+from .output import (
+    OutputBuffer,
+    OutputRetention,
+    OutputStream,
+    OutputTarget,
+    OutputView,
+)
+from .process import (
+    ChildProcess,
+    InputSource,
+    LaunchSpec,
+    ShellSession,
+    ShellSessionPool,
+)
+from .util import TokenBucket
 
 
 class Run:
@@ -38,13 +71,31 @@ class Run:
         "_working_directory",
         "_command_type",
         "_buffer_size",
-        "_read_lock",
-        "_read_timeout",
+        "_process_semaphore",
+        "_process_slot_acquired",
+        "_spawn_limiter",
+        "_kill_grace_period",
+        "_session_pool",
+        "_session",
+        "_launch_spec",
+        "_owned_files",
+        "_stdin_target",
+        "_stdout",
+        "_stderr",
+        "_stdout_stream",
+        "_output_pump",
+        "_stdout_target",
+        "_stderr_target",
+        "_text",
+        "_encoding",
+        "_errors",
         "_loop",
         "_executor",
         "_semaphore",
         "_return_code",
         "_return_code_read_lock",
+        "_completed",
+        "_events",
         "task_name",
     )
 
@@ -54,9 +105,16 @@ class Run:
         task_name: str,
         call: Callable[..., Awaitable[Any]] | str,
         task_type: TaskType,
-        executor: ProcessPoolExecutor | ThreadPoolExecutor,
+        executor: ProcessPoolExecutor | ThreadPoolExecutor | ElasticExecutor,
         semaphore: asyncio.Semaphore,
         timeout: Optional[int] = None,
+        events: RunEventBus | None = None,
+        buffer_size: int = 2**16,
+        process_semaphore: asyncio.Semaphore | None = None,
+        spawn_limiter: TokenBucket | None = None,
+        kill_grace_period: int | float = 5,
+        session_pool: ShellSessionPool | None = None,
+        launch_spec: LaunchSpec | None = None,
     ) -> None:
         self.run_id = run_id
         self.task_name = task_name
@@ -79,7 +137,6 @@ class Run:
         self._args: tuple[Any, ...] | None = None
         self._env: dict[str, Any] | None = None
         self._working_directory: str | None = None
-        self._read_lock = asyncio.Lock()
 
         if not isinstance(self.call, str) and hasattr(call, "__self__"):
             bound_instance = call.__self__
@@ -87,15 +144,34 @@ class Run:
             setattr(bound_instance, self.call.__name__, self.call)
 
         self._task: Optional[asyncio.Task] = None
-        self._process: Process | None = None
+        self._process: ChildProcess | None = None
         self._command_type: CommandType = "subprocess"
-        self._buffer_size = 8192
-        self._read_timeout: int | float = 1
+        self._buffer_size = buffer_size
+        self._process_semaphore = process_semaphore
+        self._process_slot_acquired = False
+        self._spawn_limiter = spawn_limiter
+        self._kill_grace_period = kill_grace_period
+        self._session_pool = session_pool
+        self._session: ShellSession | None = None
+        self._launch_spec = launch_spec
+        self._owned_files: list[io.IOBase] = []
+        self._stdout = OutputBuffer()
+        self._stderr = OutputBuffer()
+        self._stdout_stream: OutputStream | None = None
+        self._output_pump: asyncio.Future | None = None
+        self._stdin_target: InputSource = None
+        self._stdout_target: OutputTarget = None
+        self._stderr_target: OutputTarget = None
+        self._text = True
+        self._encoding = "utf-8"
+        self._errors = "strict"
         self._loop = asyncio.get_event_loop()
         self._executor = executor
         self._semaphore = semaphore
         self._return_code: int | None = None
         self._return_code_read_lock = asyncio.Lock()
+        self._completed = asyncio.Event()
+        self._events = events
 
     def to_dict(self):
         return {"run_id": self.run_id, "task_name": self.task_name}
@@ -131,73 +207,242 @@ class Run:
     def created(self):
         return self.status == RunStatus.CREATED
 
+    @property
+    def done(self):
+        return self._completed.is_set()
+
     @property
     def pid(self):
         if self._process:
             return self._process.pid
 
+        if self._session:
+            return self._session.pid
+
     @property
     def return_code(self):
         return self._return_code
 
-    async def get_stdout(self):
-        buffer = bytearray()
-
+    @property
+    def usage(self):
         if self._process:
-            chunk = await self._read_stdout_with_timeout()
-            buffer.extend(chunk)
+            return self._process.usage
+
+    @property
+    def truncated(self):
+        return self._stdout.truncated or self._stderr.truncated
 
-            while chunk:
-                chunk = await self._read_stdout_with_timeout()
-                buffer.extend(chunk)
+    @property
+    def stdout_path(self):
+        if isinstance(self._stdout_target, (str, pathlib.Path)):
+            return str(self._stdout_target)
 
-        return bytes(buffer).decode()
+    @property
+    def stderr_path(self):
+        if isinstance(self._stderr_target, (str, pathlib.Path)):
+            return str(self._stderr_target)
 
-    async def get_stderr(self):
-        buffer = bytearray()
-        if self._process:
-            chunk = await self._read_stderr_with_timeout()
-            buffer.extend(chunk)
+    async def get_stdout(self, since: int = 0):
+        return self._stdout.read(since=since).decode(self._encoding, self._errors)
 
-            while chunk:
-                chunk = await self._read_stderr_with_timeout()
-                buffer.extend(chunk)
+    async def get_stderr(self, since: int = 0):
+        return self._stderr.read(since=since).decode(self._encoding, self._errors)
 
-        return bytes(buffer).decode()
+    def _open_output_target(self, target: OutputTarget):
+        if target is None:
+            return subprocess.PIPE
 
-    async def _read_stderr_with_timeout(self):
-        await self._read_lock.acquire()
+        if isinstance(target, (str, pathlib.Path)):
+            output = open(target, "ab")
+            self._owned_files.append(output)
 
-        try:
-            chunk = await asyncio.wait_for(
-                self._process.stderr.read(self._buffer_size),
-                timeout=self._read_timeout,
+            return output
+
+        return target
+
+    def _open_input_source(self, source: InputSource):
+        if source is None:
+            return None
+
+        if isinstance(source, (str, pathlib.Path)):
+            source = open(source, "rb")
+            self._owned_files.append(source)
+
+            return source
+
+        if isinstance(source, (bytes, bytearray, memoryview)) or hasattr(
+            source, "__aiter__"
+        ):
+            return subprocess.PIPE
+
+        return source
+
+    def _read_output(
+        self,
+        buffer: OutputBuffer,
+        target: OutputTarget = None,
+        since: int = 0,
+    ):
+        if target is not None:
+            return None
+
+        if buffer.spilled or not self._text:
+            return buffer.view(
+                since=since,
+                encoding=self._encoding,
+                errors=self._errors,
             )
 
-        except asyncio.TimeoutError:
-            chunk = b""
+        return buffer.read(since=since).decode(self._encoding, self._errors)
+
+    def _failure_message(self, stderr: str | OutputView | None):
+        if isinstance(stderr, OutputView):
+            stderr = bytes(stderr).decode(self._encoding, "replace")
 
-        if self._read_lock.locked():
-            self._read_lock.release()
+        return f"Err. - Task Run - {self.run_id} - failed. Encountered exception - {stderr}."
+
+    async def stream_stdout(
+        self,
+        lines: bool = True,
+        since: int = 0,
+    ) -> AsyncIterator[str | bytes]:
+        if self._stdout_stream is None:
+            async for output in self._stream_output(
+                self._read_buffer(self._stdout, since=since),
+                lines=lines,
+            ):
+                yield output
 
-        return chunk
+            return
 
-    async def _read_stdout_with_timeout(self):
-        await self._read_lock.acquire()
+        self._stdout_stream.attach()
 
         try:
-            chunk = await asyncio.wait_for(
-                self._process.stdout.read(self._buffer_size),
-                timeout=self._read_timeout,
-            )
+            async for output in self._stream_output(
+                self._read_stream(self._stdout_stream, since=since),
+                lines=lines,
+            ):
+                yield output
 
-        except asyncio.TimeoutError:
-            chunk = b""
+        finally:
+            self._stdout_stream.detach()
+
+    async def stream_stderr(
+        self,
+        lines: bool = True,
+        since: int = 0,
+    ) -> AsyncIterator[str | bytes]:
+        async for output in self._stream_output(
+            self._read_buffer(self._stderr, since=since),
+            lines=lines,
+        ):
+            yield output
+
+    async def _read_buffer(self, buffer: OutputBuffer, since: int = 0):
+        while True:
+            await buffer.wait(since=since)
+
+            chunk = buffer.read(since=since)
+            since = max(since, buffer.size)
+
+            yield chunk, buffer.closed
+
+            if buffer.closed:
+                break
 
-        if self._read_lock.locked():
-            self._read_lock.release()
+    async def _read_stream(self, stream: OutputStream, since: int = 0):
+        offset = 0
 
-        return chunk
+        while chunk := await stream.read():
+            start = max(since - offset, 0)
+            offset += len(chunk)
+
+            if start < len(chunk):
+                yield chunk[start:], False
+
+        yield b"", True
+
+    async def _stream_output(
+        self,
+        chunks: AsyncIterator[tuple[bytes, bool]],
+        lines: bool = True,
+    ):
+        decoder: codecs.IncrementalDecoder | None = None
+        pending: str | bytes = b""
+        newline: str | bytes = b"\n"
+
+        if self._text:
+            decoder = codecs.getincrementaldecoder(self._encoding)(errors=self._errors)
+            pending = ""
+            newline = "\n"
+
+        async for chunk, final in chunks:
+            output = chunk
+            if decoder:
+                output = decoder.decode(chunk, final=final)
+
+            if not lines:
+                if output:
+                    yield output
+
+            else:
+                pending += output
+                *completed, pending = pending.split(newline)
+
+                for line in completed:
+                    yield line + newline
+
+        if pending:
+            yield pending
+
+    async def _pump_stream(
+        self,
+        stream: asyncio.StreamReader | None,
+        output: OutputStream,
+    ):
+        try:
+            while stream and (chunk := await stream.read(self._buffer_size)):
+                await output.write(chunk)
+
+        finally:
+            output.close()
+
+    async def _pump_output(
+        self,
+        stream: asyncio.StreamReader | None,
+        buffer: OutputBuffer,
+    ):
+        try:
+            while stream and (chunk := await stream.read(self._buffer_size)):
+                buffer.write(chunk)
+
+        finally:
+            buffer.close()
+
+    async def _feed_input(self, stream: asyncio.StreamWriter | None):
+        if stream is None:
+            return
+
+        source = self._stdin_target
+
+        try:
+            if isinstance(source, (bytes, bytearray, memoryview)):
+                data = memoryview(source).cast("B")
+
+                for offset in range(0, len(data), self._buffer_size):
+                    stream.write(data[offset : offset + self._buffer_size])
+                    await stream.drain()
+
+            else:
+                async for chunk in source:
+                    stream.write(chunk)
+                    await stream.drain()
+
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+        finally:
+            stream.close()
 
     @property
     def task_running(self):
@@ -206,23 +451,44 @@ class Run:
 
         return self._task and not self._task.done() and not self._task.cancelled()
 
-    async def get_run_update(self):
-        if self._process:
-            stderr = await self.get_stderr()
-            stdout = await self.get_stdout()
+    async def get_run_update(self, since: OutputCursor | None = None):
+        if self.task_type == TaskType.SHELL:
+            if since is None:
+                since = OutputCursor()
+
+            cursor = OutputCursor(
+                stdout=self._stdout.size,
+                stderr=self._stderr.size,
+            )
+
+            stderr = self._read_output(
+                self._stderr,
+                target=self._stderr_target,
+                since=since.stderr,
+            )
+            stdout = self._read_output(
+                self._stdout,
+                target=self._stdout_target,
+                since=since.stdout,
+            )
 
             return ShellProcess(
                 run_id=self.run_id,
                 task_name=self.task_name,
-                process_id=self._process.pid,
+                process_id=self.pid,
                 command=self.call,
                 args=self._args,
                 status=self.status,
                 env=self._env,
                 working_directory=self._working_directory,
+                stdout_path=self.stdout_path,
+                stderr_path=self.stderr_path,
+                truncated=self.truncated,
+                usage=self.usage,
                 command_type=self._command_type,
                 error=stderr,
                 result=stdout,
+                cursor=cursor,
                 trace=self.trace,
                 elapsed=time.monotonic() - self.start,
             )
@@ -240,9 +506,22 @@ class Run:
         )
 
     def update_status(self, status: RunStatus):
+        if self.status in [RunStatus.COMPLETE, RunStatus.FAILED, RunStatus.CANCELLED]:
+            return
+
+        previous_status = self.status
         self.status = status
         self.elapsed = time.monotonic() - self.start
 
+        if self._events:
+            self._events.publish(
+                self.run_id,
+                self.task_name,
+                status,
+                previous_status=previous_status,
+                task_type=self.task_type,
+            )
+
     async def complete(self):
         completed = self.status in [RunStatus.COMPLETE, RunStatus.FAILED]
 
@@ -253,36 +532,49 @@ class Run:
             except (asyncio.InvalidStateError, asyncio.CancelledError):
                 pass
 
+    async def wait(self):
+        if self._stdout_stream and not self._stdout_stream.attached:
+            self._stdout_stream.detach()
+
+        await self._completed.wait()
+        return await self.complete()
+
     async def cancel(self):
-        if self._process:
-            try:
-                self._process.terminate()
+        self.update_status(RunStatus.CANCELLED)
+        self._cancel_task()
+        self._completed.set()
 
-            except Exception:
-                pass
+        if self._process and self._process.returncode is None:
+            await self._terminate_process_group()
 
-        try:
-            self._task.set_result(None)
+        elif self._session and self._return_code is None:
+            self._session.kill()
 
-        except Exception:
-            pass
+    def send_signal(self, sig: signal.Signals):
+        if self._process and self._process.returncode is None:
+            self._signal_process_group(sig)
 
-        self.status = RunStatus.CANCELLED
+        elif self._session and self._return_code is None:
+            self._session.kill()
 
     def abort(self):
-        if self._process:
-            self._process.kill()
+        if self._process and self._process.returncode is None:
+            self._signal_process_group(signal.SIGKILL)
 
-        try:
-            self._task.set_result(None)
+        elif self._session and self._return_code is None:
+            self._session.kill()
 
-        except Exception:
-            pass
+        self.update_status(RunStatus.CANCELLED)
+        self._cancel_task()
+        self._completed.set()
 
-        self.status = RunStatus.CANCELLED
+    def _cancel_task(self):
+        if self._task and self._process is None and self._session is None:
+            self._task.cancel()
 
     def execute(self, *args, **kwargs):
         self._task = asyncio.ensure_future(self._execute(*args, **kwargs))
+        self._task.add_done_callback(self._complete_run)
 
     def execute_shell(
         self,
@@ -291,23 +583,197 @@ class Run:
         env: Dict[str, str] | None = None,
         cwd: str | pathlib.Path | None = None,
         shell: bool = False,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        process_limit: bool = True,
+        owned_files: Sequence[io.IOBase] = (),
+        stream_output: bool = False,
+        cache: ShellCache | None = None,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
         timeout: int | float | None = None,
     ):
         self._args = args
         self._env = env
+        self.timeout = timeout or self.timeout
+        self._stdin_target = stdin
+        self._stdout_target = stdout
+
+        if not process_limit:
+            self._process_semaphore = None
+
+        self._owned_files.extend(owned_files)
+
+        if stream_output:
+            self._stdout_stream = OutputStream(max_pending=self._buffer_size)
+
+        self._stderr_target = stderr
+        self._text = text
+        self._encoding = encoding
+        self._errors = errors
+
+        self._stdout = OutputBuffer(
+            spill_threshold=spill_threshold,
+            max_size=max_output_bytes,
+            retention=keep_output,
+        )
+
+        self._stderr = OutputBuffer(
+            spill_threshold=spill_threshold,
+            max_size=max_output_bytes,
+            retention=keep_output,
+        )
 
         if cwd:
             self._working_directory = str(cwd)
 
-        self._task = asyncio.ensure_future(
-            self._execute_shell(
+        if (
+            session
+            and stdin is None
+            and not stream_output
+            and self._session_pool
+            and self._session_redirects() is not None
+        ):
+            execution = self._execute_in_session(
                 *args,
                 env=env,
                 cwd=cwd,
                 shell=shell,
-                timeout=timeout,
+                timeout=self.timeout,
+            )
+
+        else:
+            execution = self._execute_shell(
+                *args,
+                env=env,
+                cwd=cwd,
+                shell=shell,
+                timeout=self.timeout,
                 poll_interval=poll_interval,
             )
+
+        if (
+            cache
+            and stdin is None
+            and stdout is None
+            and stderr is None
+            and not stream_output
+        ):
+            execution = self._execute_cached(
+                execution,
+                cache,
+                cwd=cwd,
+                shell=shell,
+                inputs=cache_inputs,
+            )
+
+        self._task = asyncio.ensure_future(execution)
+        self._task.add_done_callback(self._complete_run)
+
+    def _complete_run(self, _: asyncio.Future):
+        if self._process_slot_acquired:
+            self._process_semaphore.release()
+            self._process_slot_acquired = False
+
+        self._close_owned_files()
+
+        self._stdout.close()
+        self._stderr.close()
+
+        if self._stdout_stream:
+            self._stdout_stream.close()
+
+        self._completed.set()
+
+    def _close_owned_files(self):
+        for owned_file in self._owned_files:
+            owned_file.close()
+
+        self._owned_files.clear()
+
+    async def _execute_cached(
+        self,
+        execution: Coroutine[Any, Any, ShellProcess | None],
+        cache: ShellCache,
+        cwd: str | pathlib.Path | None = None,
+        shell: bool = False,
+        inputs: Sequence[str | pathlib.Path] | None = None,
+    ):
+        executable: str | None = None
+        if self._launch_spec and not shell:
+            executable = self._launch_spec.executable(self._launch_spec.env(self._env))
+
+        try:
+            key = await asyncio.to_thread(
+                cache.key,
+                self.call,
+                args=self._args,
+                env=self._env,
+                cwd=str(cwd) if cwd else None,
+                shell=shell,
+                executable=executable,
+                inputs=inputs,
+            )
+
+            entry = await asyncio.to_thread(cache.get, key)
+
+        except Exception:
+            return await execution
+
+        if entry is None:
+            shell_process = await execution
+
+            if self.completed and shell_process and not self.truncated:
+                try:
+                    await asyncio.to_thread(
+                        cache.put,
+                        key,
+                        shell_process,
+                        self._stdout.read(),
+                        self._stderr.read(),
+                    )
+
+                except Exception:
+                    pass
+
+            return shell_process
+
+        execution.close()
+
+        process, stdout, stderr = entry
+        self._stdout.write(stdout)
+        self._stderr.write(stderr)
+        self._return_code = process["return_code"]
+
+        self.result = self._read_output(self._stdout)
+        if stderr:
+            self.error = self._read_output(self._stderr)
+
+        self.update_status(RunStatus.COMPLETE)
+
+        self.end = time.monotonic()
+        self.elapsed = self.end - self.start
+
+        return ShellProcess(
+            **{
+                **process,
+                "run_id": self.run_id,
+                "task_name": self.task_name,
+                "status": self.status,
+                "error": self.error,
+                "result": self.result,
+                "truncated": self.truncated,
+                "start": self.start,
+                "end": self.end,
+                "elapsed": self.elapsed,
+            }
         )
 
     async def _execute_shell(
@@ -326,59 +792,133 @@ class Run:
         if cwd:
             working_directory = pathlib.Path(cwd)
 
+        if self._process_semaphore or self._spawn_limiter:
+            self.update_status(RunStatus.PENDING)
+
+        if self._process_semaphore:
+            await self._process_semaphore.acquire()
+            self._process_slot_acquired = True
+
+        if self._spawn_limiter:
+            await self._spawn_limiter.acquire()
+
+        if self.status == RunStatus.CANCELLED:
+            return
+
+        executable: str | None = None
+        if self._launch_spec:
+            env = self._launch_spec.env(env)
+
+            if not shell:
+                executable = self._launch_spec.executable(env)
+
+        stdin = self._open_input_source(self._stdin_target)
+        stdout = self._open_output_target(self._stdout_target)
+        stderr = self._open_output_target(self._stderr_target)
+
         try:
             if shell:
                 command = [self.call]
                 command.extend(args)
 
-                self._process = await asyncio.create_subprocess_shell(
+                self._process = await ChildProcess.create(
                     " ".join(command),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    shell=True,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
                     env=env,
                     cwd=working_directory if cwd else None,
+                    limit=self._buffer_size,
+                    start_new_session=True,
                 )
 
             else:
-                self._process = await asyncio.create_subprocess_exec(
-                    self.call,
-                    *args,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                self._process = await ChildProcess.create(
+                    [self.call, *args],
+                    executable=executable,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
                     env=env,
                     cwd=working_directory if cwd else None,
+                    limit=self._buffer_size,
+                    start_new_session=True,
                 )
 
-        except Exception:
-            pass
+        except Exception as err:
+            if isinstance(err, FileNotFoundError) and self._launch_spec:
+                self._launch_spec.invalidate()
+
+            self.error = f"Err. - Task Run - {self.run_id} - encountered error {str(err)}."
+            self.trace = traceback.format_exc()
+            self.update_status(RunStatus.FAILED)
 
-        self.status = RunStatus.RUNNING
+        finally:
+            self._close_owned_files()
+
+        if self._process is None:
+            self.end = time.monotonic()
+            self.elapsed = self.end - self.start
+
+            return ShellProcess(
+                run_id=self.run_id,
+                task_name=self.task_name,
+                command=self.call,
+                args=self._args,
+                status=self.status,
+                env=self._env,
+                working_directory=self._working_directory,
+                stdout_path=self.stdout_path,
+                stderr_path=self.stderr_path,
+                command_type=self._command_type,
+                error=self.error,
+                trace=self.trace,
+                start=self.start,
+                end=self.end,
+                elapsed=self.elapsed,
+            )
+
+        self.update_status(RunStatus.RUNNING)
 
         stderr: str | None = (None,)
         stdout: str | None = None
 
         try:
+            self._output_pump = asyncio.gather(
+                self._feed_input(self._process.stdin),
+                (
+                    self._pump_stream(self._process.stdout, self._stdout_stream)
+                    if self._stdout_stream
+                    else self._pump_output(self._process.stdout, self._stdout)
+                ),
+                self._pump_output(self._process.stderr, self._stderr),
+            )
+
             if timeout:
-                self._return_code = await asyncio.wait_for(
-                    self._process.wait(),
+                await asyncio.wait_for(
+                    self._wait_for_exit(),
                     timeout=timeout,
                 )
 
-                stderr = await self.get_stderr()
-                stdout = await self.get_stdout()
+                stderr = self._read_output(self._stderr, target=self._stderr_target)
+                stdout = self._read_output(self._stdout, target=self._stdout_target)
 
             else:
-                self._return_code = await self._process.wait()
+                await self._wait_for_exit()
 
-                stderr = await self.get_stderr()
-                stdout = await self.get_stdout()
+                stderr = self._read_output(self._stderr, target=self._stderr_target)
+                stdout = self._read_output(self._stdout, target=self._stdout_target)
 
         except asyncio.TimeoutError:
             error = f"Err. - Task Run - {self.run_id} - timed out. Exceeded deadline of - {self.timeout} - seconds."
-            self.status = RunStatus.FAILED
+            self.update_status(RunStatus.FAILED)
+
+            await self._terminate_process_group()
+            await self._stop_output_pump()
 
-            stderr = await self.get_stderr()
-            stdout = await self.get_stdout()
+            self.end = time.monotonic()
+            self.elapsed = self.end - self.start
 
             return ShellProcess(
                 run_id=self.run_id,
@@ -389,16 +929,27 @@ class Run:
                 status=self.status,
                 env=self._env,
                 working_directory=self._working_directory,
+                stdout_path=self.stdout_path,
+                stderr_path=self.stderr_path,
+                truncated=self.truncated,
+                usage=self.usage,
                 command_type=self._command_type,
                 error=error,
                 trace=self.trace,
-                elapsed=self.start - time.monotonic(),
+                start=self.start,
+                end=self.end,
+                elapsed=self.elapsed,
             )
 
         except Exception as err:
             error = f"Err. - Task Run - {self.run_id} - encountered error {str(err)}."
             self.trace = traceback.format_exc()
-            self.status = RunStatus.FAILED
+            self.update_status(RunStatus.FAILED)
+
+            await self._stop_output_pump()
+
+            self.end = time.monotonic()
+            self.elapsed = self.end - self.start
 
             return ShellProcess(
                 run_id=self.run_id,
@@ -409,22 +960,34 @@ class Run:
                 status=self.status,
                 env=self._env,
                 working_directory=self._working_directory,
+                stdout_path=self.stdout_path,
+                stderr_path=self.stderr_path,
+                truncated=self.truncated,
+                usage=self.usage,
                 command_type=self._command_type,
                 error=error,
                 trace=self.trace,
-                elapsed=self.start - time.monotonic(),
+                start=self.start,
+                end=self.end,
+                elapsed=self.elapsed,
             )
 
         self.result = stdout
         if stderr:
             self.error = stderr
 
-        if self.return_code != 0:
-            self.error = f"Err. - Task Run - {self.run_id} - failed. Encountered exception - {stderr}."
-            self.status = RunStatus.FAILED
+        if self.cancelled:
+            pass
+
+        elif self.return_code != 0:
+            self.error = self._failure_message(stderr)
+            self.update_status(RunStatus.FAILED)
 
         else:
-            self.status = RunStatus.COMPLETE
+            self.update_status(RunStatus.COMPLETE)
+
+        self.end = time.monotonic()
+        self.elapsed = self.end - self.start
 
         return ShellProcess(
             run_id=self.run_id,
@@ -436,16 +999,197 @@ class Run:
             return_code=self._return_code,
             env=self._env,
             working_directory=self._working_directory,
+            stdout_path=self.stdout_path,
+            stderr_path=self.stderr_path,
+            truncated=self.truncated,
+            usage=self.usage,
+            command_type=self._command_type,
+            error=self.error,
+            result=self.result,
+            trace=self.trace,
+            start=self.start,
+            end=self.end,
+            elapsed=self.elapsed,
+        )
+
+    def _session_redirects(self):
+        redirects: list[str] = []
+
+        for operator, target in (
+            (">>", self._stdout_target),
+            ("2>>", self._stderr_target),
+        ):
+            if target is None:
+                continue
+
+            elif isinstance(target, (str, pathlib.Path)):
+                redirects.append(f"{operator} {shlex.quote(str(target))}")
+
+            elif target == subprocess.DEVNULL:
+                redirects.append(f"{operator} /dev/null")
+
+            else:
+                return None
+
+        return " ".join(redirects)
+
+    async def _execute_in_session(
+        self,
+        *args: tuple[Any, ...],
+        env: Dict[str, str] | None = None,
+        cwd: str | pathlib.Path | None = None,
+        shell: bool = False,
+        timeout: int | float | None = None,
+    ):
+        if shell:
+            self._command_type = "shell"
+            command = " ".join([self.call, *args])
+
+        else:
+            command = shlex.join([self.call, *args])
+
+        if cwd:
+            command = f"cd {shlex.quote(str(cwd))} || exit 1; {command}"
+
+        if env:
+            exports = "".join(
+                f"export {name}={shlex.quote(str(value))}; "
+                for name, value in env.items()
+            )
+
+            command = f"{exports}{command}"
+
+        self.update_status(RunStatus.PENDING)
+        self._session = await self._session_pool.acquire()
+
+        if self.cancelled:
+            self._session_pool.release(self._session)
+            return
+
+        self.update_status(RunStatus.RUNNING)
+
+        try:
+            self._return_code = await asyncio.wait_for(
+                self._session.execute(
+                    command,
+                    self._stdout,
+                    self._stderr,
+                    redirects=self._session_redirects(),
+                ),
+                timeout=timeout,
+            )
+
+        except asyncio.TimeoutError:
+            self._session.kill()
+            self.error = f"Err. - Task Run - {self.run_id} - timed out. Exceeded deadline of - {self.timeout} - seconds."
+            self.update_status(RunStatus.FAILED)
+
+        except Exception as err:
+            if not self.cancelled:
+                self.error = f"Err. - Task Run - {self.run_id} - encountered error {str(err)}."
+                self.trace = traceback.format_exc()
+                self.update_status(RunStatus.FAILED)
+
+        finally:
+            self._session_pool.release(self._session)
+
+        if self._return_code is not None:
+            stderr = self._read_output(self._stderr, target=self._stderr_target)
+            self.result = self._read_output(self._stdout, target=self._stdout_target)
+
+            if stderr:
+                self.error = stderr
+
+            if self.cancelled:
+                pass
+
+            elif self._return_code != 0:
+                self.error = self._failure_message(stderr)
+                self.update_status(RunStatus.FAILED)
+
+            else:
+                self.update_status(RunStatus.COMPLETE)
+
+        self.end = time.monotonic()
+        self.elapsed = self.end - self.start
+
+        return ShellProcess(
+            run_id=self.run_id,
+            task_name=self.task_name,
+            process_id=self.pid,
+            command=self.call,
+            args=self._args,
+            status=self.status,
+            return_code=self._return_code,
+            env=self._env,
+            working_directory=self._working_directory,
+            stdout_path=self.stdout_path,
+            stderr_path=self.stderr_path,
+            truncated=self.truncated,
             command_type=self._command_type,
             error=self.error,
             result=self.result,
             trace=self.trace,
-            elapsed=self.start - time.monotonic(),
+            start=self.start,
+            end=self.end,
+            elapsed=self.elapsed,
         )
 
+    async def _terminate_process_group(self):
+        deadline = time.monotonic() + self._kill_grace_period
+        self._signal_process_group(signal.SIGTERM)
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(self._process.wait()),
+                timeout=max(deadline - time.monotonic(), 0),
+            )
+
+        except asyncio.TimeoutError:
+            pass
+
+        while self._process_group_alive() and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        if self._process_group_alive():
+            self._signal_process_group(signal.SIGKILL)
+
+    def _signal_process_group(self, sig: signal.Signals):
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self._process.pid, sig)
+
+            else:
+                self._process.send_signal(sig)
+
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _process_group_alive(self):
+        if not hasattr(os, "killpg"):
+            return self._process.returncode is None
+
+        try:
+            os.killpg(self._process.pid, 0)
+            return True
+
+        except (ProcessLookupError, PermissionError):
+            return False
+
+    async def _stop_output_pump(self):
+        if self._output_pump is None:
+            return
+
+        self._output_pump.cancel()
+        await asyncio.gather(self._output_pump, return_exceptions=True)
+
+    async def _wait_for_exit(self):
+        self._return_code = await self._process.wait()
+        await self._output_pump
+
     async def _execute(self, *args, **kwargs):
         try:
-            self.status = RunStatus.RUNNING
+            self.update_status(RunStatus.RUNNING)
 
             is_coroutine = (
                 inspect.iscoroutine(self.call)
@@ -462,33 +1206,30 @@ class Run:
                 self.result = await self.call(*args, **kwargs)
 
             elif self.timeout:
-                await self._semaphore.acquire()
-                self.result = await asyncio.wait_for(
-                    self._loop.run_in_executor(
-                        self._executor, functools.partial(self.call, *args, **kwargs)
+                async with self._semaphore:
+                    self.result = await asyncio.wait_for(
+                        self._loop.run_in_executor(
+                            self._executor, functools.partial(self.call, *args, **kwargs)
+                        ),
+                        timeout=self.timeout,
                     )
-                )
-
-                self._semaphore.release()
 
             else:
-                await self._semaphore.acquire()
-                self.result = await self._loop.run_in_executor(
-                    self._executor, functools.partial(self.call, *args, **kwargs)
-                )
-
-                self._semaphore.release()
+                async with self._semaphore:
+                    self.result = await self._loop.run_in_executor(
+                        self._executor, functools.partial(self.call, *args, **kwargs)
+                    )
 
-            self.status = RunStatus.COMPLETE
+            self.update_status(RunStatus.COMPLETE)
 
         except asyncio.TimeoutError:
             self.error = f"Err. - Task Run - {self.run_id} - timed out. Exceeded deadline of - {self.timeout} - seconds."
-            self.status = RunStatus.FAILED
+            self.update_status(RunStatus.FAILED)
 
         except Exception as e:
             self.error = f"Err. - Task Run - {self.run_id} - failed. Encountered exception - {str(e)}."
             self.trace = traceback.format_exc()
-            self.status = RunStatus.FAILED
+            self.update_status(RunStatus.FAILED)
 
         self.end = time.monotonic()
         self.elapsed = self.end - self.start
@@ -1,5 +1,7 @@
 import asyncio
+import io
 import pathlib
+import signal
 import time
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
@@ -8,16 +10,21 @@ from typing import (
     Callable,
     Dict,
     Generic,
-    List,
     Literal,
     Optional,
+    Sequence,
     TypeVar,
 )
 
-from .models import RunStatus, TaskType
+from .cache import ShellCache
+from .events import RunEventBus
+from .executors import ElasticExecutor
+from .models import OutputCursor, RunStatus, TaskType
+from .output import OutputRetention, OutputTarget
+from .process import InputSource, LaunchSpec, ShellSessionPool
 from .run import Run
 from .snowflake import SnowflakeGenerator
-from .util import TimeParser
+from .util import TimeParser, TokenBucket
 
 T = TypeVar("T")
 
@@ -28,7 +35,7 @@ class Task(Generic[T]):
         snowflake_generator: SnowflakeGenerator,
         name: str,
         task: Callable[[], T] | str,
-        executor: ProcessPoolExecutor | ThreadPoolExecutor,
+        executor: ProcessPoolExecutor | ThreadPoolExecutor | ElasticExecutor,
         semaphore: asyncio.Semaphore,
         *args: tuple[Any, ...],
         schedule: str | None = None,
@@ -39,6 +46,12 @@ class Task(Generic[T]):
         max_age: str | None = None,
         keep_policy: Literal["COUNT", "AGE", "COUNT_AND_AGE"] = "COUNT",
         task_type: TaskType = TaskType.CALLABLE,
+        events: RunEventBus | None = None,
+        buffer_size: int = 2**16,
+        process_semaphore: asyncio.Semaphore | None = None,
+        spawn_limiter: TokenBucket | None = None,
+        kill_grace_period: int | float = 5,
+        session_pool: ShellSessionPool | None = None,
     ) -> None:
         self._snowflake_generator = snowflake_generator
         self.task_id = snowflake_generator.generate()
@@ -77,6 +90,20 @@ class Task(Generic[T]):
         self._sem = asyncio.Semaphore(keep)
         self._executor = executor
         self._executor_semaphore = semaphore
+        self._events = events
+        self._buffer_size = buffer_size
+        self._process_semaphore = process_semaphore
+        self._spawn_limiter = spawn_limiter
+        self._kill_grace_period = kill_grace_period
+        self._session_pool = session_pool
+
+        self._launch_spec: LaunchSpec | None = None
+        if task_type == TaskType.SHELL:
+            self._launch_spec = LaunchSpec(task)
+
+    @property
+    def launch_spec(self):
+        return self._launch_spec
 
     @property
     def status(self):
@@ -85,8 +112,26 @@ class Task(Generic[T]):
 
         return RunStatus.IDLE
 
-    async def get_run_update(self, run_id: int):
-        return await self._runs[run_id].get_run_update()
+    async def get_run_update(
+        self,
+        run_id: int,
+        since: OutputCursor | None = None,
+    ):
+        return await self._runs[run_id].get_run_update(since=since)
+
+    def stream(
+        self,
+        run_id: int,
+        output: Literal["stdout", "stderr"] = "stdout",
+        lines: bool = True,
+        since: int = 0,
+    ):
+        run = self._runs[run_id]
+
+        if output == "stderr":
+            return run.stream_stderr(lines=lines, since=since)
+
+        return run.stream_stdout(lines=lines, since=since)
 
     def get_run_status(self, run_id: str):
         if run := self._runs.get(run_id):
@@ -106,6 +151,13 @@ class Task(Generic[T]):
         if run := self._runs.get(run_id):
             return await run.complete()
 
+    async def wait(self, run_id: int):
+        if run := self._runs.get(run_id):
+            return await run.wait()
+
+    def discard(self, run_id: int):
+        return self._runs.pop(run_id, None)
+
     async def cancel(self, run_id: str):
         if run := self._runs.get(run_id):
             await run.cancel()
@@ -135,6 +187,10 @@ class Task(Generic[T]):
                 except Exception:
                     pass
 
+    def send_signal(self, sig: signal.Signals):
+        for run in self._runs.values():
+            run.send_signal(sig)
+
     def abort(self):
         for run in self._runs.values():
             run.abort()
@@ -164,37 +220,40 @@ class Task(Generic[T]):
                 pass
 
     async def _execute_count_policy(self):
-        removed_runs: List[Run] = []
         if len(self._runs) > self.keep:
-            run_ids = list(sorted(self._runs))
-            for run_id in run_ids[: self.keep]:
-                removed_runs.append(self._runs[run_id])
+            finished = [
+                run_id for run_id in sorted(self._runs) if self._runs[run_id].done
+            ]
+            for run_id in finished[: len(self._runs) - self.keep]:
                 del self._runs[run_id]
 
-        if len(removed_runs) > 0:
-            await asyncio.gather(
-                *[run.cancel() for run in removed_runs], return_exceptions=True
-            )
-
     async def _execute_age_policy(self):
-        removed_runs: List[Run] = []
         current_time = time.monotonic()
         for run_id, run in list(self._runs.items()):
-            if current_time - run.start > self.max_age:
-                removed_runs.append(run)
+            if run.done and current_time - run.start > self.max_age:
                 del self._runs[run_id]
 
-        if len(removed_runs) > 0:
-            await asyncio.gather(
-                *[run.cancel() for run in removed_runs], return_exceptions=True
-            )
-
     def run_shell(
         self,
         *args: tuple[Any, ...],
         env: Dict[str, str] | None = None,
         cwd: str | pathlib.Path | None = None,
         shell: bool = False,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        process_limit: bool = True,
+        owned_files: Sequence[io.IOBase] = (),
+        stream_output: bool = False,
+        cache: ShellCache | None = None,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
         run_id: Optional[str] = None,
         timeout: Optional[int | float] = None,
         poll_interval: int | float = 0.5,
@@ -213,6 +272,13 @@ class Task(Generic[T]):
             self._executor,
             self._executor_semaphore,
             timeout=timeout,
+            events=self._events,
+            buffer_size=self._buffer_size,
+            process_semaphore=self._process_semaphore,
+            spawn_limiter=self._spawn_limiter,
+            kill_grace_period=self._kill_grace_period,
+            session_pool=self._session_pool,
+            launch_spec=self._launch_spec,
         )
 
         run.execute_shell(
@@ -220,6 +286,21 @@ class Task(Generic[T]):
             env=env,
             cwd=cwd,
             shell=shell,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            spill_threshold=spill_threshold,
+            text=text,
+            encoding=encoding,
+            errors=errors,
+            max_output_bytes=max_output_bytes,
+            keep_output=keep_output,
+            session=session,
+            process_limit=process_limit,
+            owned_files=owned_files,
+            stream_output=stream_output,
+            cache=cache,
+            cache_inputs=cache_inputs,
             poll_interval=poll_interval,
         )
 
@@ -248,6 +329,13 @@ class Task(Generic[T]):
             self._executor,
             self._executor_semaphore,
             timeout=timeout,
+            events=self._events,
+            buffer_size=self._buffer_size,
+            process_semaphore=self._process_semaphore,
+            spawn_limiter=self._spawn_limiter,
+            kill_grace_period=self._kill_grace_period,
+            session_pool=self._session_pool,
+            launch_spec=self._launch_spec,
         )
 
         run.execute(*args, **kwargs)
@@ -286,6 +374,13 @@ class Task(Generic[T]):
                 self._executor,
                 self._executor_semaphore,
                 timeout=timeout,
+                events=self._events,
+                buffer_size=self._buffer_size,
+                process_semaphore=self._process_semaphore,
+                spawn_limiter=self._spawn_limiter,
+                kill_grace_period=self._kill_grace_period,
+                session_pool=self._session_pool,
+                launch_spec=self._launch_spec,
             )
 
             self._schedules[run_id] = asyncio.ensure_future(
@@ -302,6 +397,19 @@ class Task(Generic[T]):
         env: Dict[str, str] | None = None,
         cwd: str | pathlib.Path | None = None,
         shell: bool = False,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        stream_output: bool = False,
+        cache: ShellCache | None = None,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
         run_id: Optional[str] = None,
         timeout: Optional[int | float] = None,
         poll_interval: int | float = 0.5,
@@ -325,6 +433,13 @@ class Task(Generic[T]):
                 self._executor,
                 self._executor_semaphore,
                 timeout=timeout,
+                events=self._events,
+                buffer_size=self._buffer_size,
+                process_semaphore=self._process_semaphore,
+                spawn_limiter=self._spawn_limiter,
+                kill_grace_period=self._kill_grace_period,
+                session_pool=self._session_pool,
+                launch_spec=self._launch_spec,
             )
 
             self._schedules[run_id] = asyncio.ensure_future(
@@ -334,6 +449,19 @@ class Task(Generic[T]):
                     env=env,
                     cwd=cwd,
                     shell=shell,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    spill_threshold=spill_threshold,
+                    text=text,
+                    encoding=encoding,
+                    errors=errors,
+                    max_output_bytes=max_output_bytes,
+                    keep_output=keep_output,
+                    session=session,
+                    stream_output=stream_output,
+                    cache=cache,
+                    cache_inputs=cache_inputs,
                     poll_interval=poll_interval,
                 )
             )
@@ -354,9 +482,17 @@ class Task(Generic[T]):
                     self._snowflake_generator.generate(),
                     self.name,
                     self.call,
+                    self.task_type,
                     self._executor,
                     self._executor_semaphore,
                     timeout=self.timeout,
+                    events=self._events,
+                    buffer_size=self._buffer_size,
+                    process_semaphore=self._process_semaphore,
+                    spawn_limiter=self._spawn_limiter,
+                    kill_grace_period=self._kill_grace_period,
+                    session_pool=self._session_pool,
+                    launch_spec=self._launch_spec,
                 )
 
                 self._runs[run.run_id] = run
@@ -375,9 +511,17 @@ class Task(Generic[T]):
                     self._snowflake_generator.generate(),
                     self.name,
                     self.call,
+                    self.task_type,
                     self._executor,
                     self._executor_semaphore,
                     timeout=self.timeout,
+                    events=self._events,
+                    buffer_size=self._buffer_size,
+                    process_semaphore=self._process_semaphore,
+                    spawn_limiter=self._spawn_limiter,
+                    kill_grace_period=self._kill_grace_period,
+                    session_pool=self._session_pool,
+                    launch_spec=self._launch_spec,
                 )
 
                 self._runs[run.run_id] = run
@@ -390,6 +534,19 @@ class Task(Generic[T]):
         env: Dict[str, str] | None = None,
         cwd: str | pathlib.Path | None = None,
         shell: bool = False,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        stream_output: bool = False,
+        cache: ShellCache | None = None,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
         poll_interval: int | float = 0.5,
     ):
         self._runs[run.run_id] = run
@@ -401,6 +558,19 @@ class Task(Generic[T]):
                     env=env,
                     cwd=cwd,
                     shell=shell,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    spill_threshold=spill_threshold,
+                    text=text,
+                    encoding=encoding,
+                    errors=errors,
+                    max_output_bytes=max_output_bytes,
+                    keep_output=keep_output,
+                    session=session,
+                    stream_output=stream_output,
+                    cache=cache,
+                    cache_inputs=cache_inputs,
                     poll_interval=poll_interval,
                 )
 
@@ -409,9 +579,17 @@ class Task(Generic[T]):
                     self._snowflake_generator.generate(),
                     self.name,
                     self.call,
+                    self.task_type,
                     self._executor,
                     self._executor_semaphore,
                     timeout=self.timeout,
+                    events=self._events,
+                    buffer_size=self._buffer_size,
+                    process_semaphore=self._process_semaphore,
+                    spawn_limiter=self._spawn_limiter,
+                    kill_grace_period=self._kill_grace_period,
+                    session_pool=self._session_pool,
+                    launch_spec=self._launch_spec,
                 )
 
                 self._runs[run.run_id] = run
@@ -428,6 +606,19 @@ class Task(Generic[T]):
                     env=env,
                     cwd=cwd,
                     shell=shell,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    spill_threshold=spill_threshold,
+                    text=text,
+                    encoding=encoding,
+                    errors=errors,
+                    max_output_bytes=max_output_bytes,
+                    keep_output=keep_output,
+                    session=session,
+                    stream_output=stream_output,
+                    cache=cache,
+                    cache_inputs=cache_inputs,
                 )
 
                 await asyncio.sleep(self.schedule)
@@ -435,9 +626,17 @@ class Task(Generic[T]):
                     self._snowflake_generator.generate(),
                     self.name,
                     self.call,
+                    self.task_type,
                     self._executor,
                     self._executor_semaphore,
                     timeout=self.timeout,
+                    events=self._events,
+                    buffer_size=self._buffer_size,
+                    process_semaphore=self._process_semaphore,
+                    spawn_limiter=self._spawn_limiter,
+                    kill_grace_period=self._kill_grace_period,
+                    session_pool=self._session_pool,
+                    launch_spec=self._launch_spec,
                 )
 
                 self._runs[run.run_id] = run
@@ -1,33 +1,58 @@
 import asyncio
 import functools
+import io
+import itertools
+import os
+import pathlib
 import shlex
 import signal
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import (
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Iterable,
     Literal,
     Optional,
+    Sequence,
     TypeVar,
 )
 
+from .cache import ShellCache
 from .env import Env
-from .models import RunStatus, ShellProcess, TaskRun, TaskType
+from .events import RunEventBus
+from .executors import ElasticExecutor, ExecutorPool, ExecutorPoolConfig
+from .events.run_subscription import RunEventCallback
+from .models import (
+    OutputCursor,
+    RunEvent,
+    RunStatus,
+    ShellProcess,
+    TaskRun,
+    TaskType,
+)
+from .models.run_status import RunStatusName
+from .output import OutputRetention, OutputTarget
+from .process import InputSource, ShellSessionPool
+from .run import Run
 from .snowflake import SnowflakeGenerator
 from .task import Task
 from .util.time_parser import TimeParser
+from .util.token_bucket import TokenBucket
 
 T = TypeVar("T")
 
 
 def shutdown_executor(
     sig: int,
-    executor: ThreadPoolExecutor | ProcessPoolExecutor,
+    executors: Iterable[ThreadPoolExecutor | ProcessPoolExecutor | ElasticExecutor],
     default_handler: Callable[..., Any],
 ):
-    executor.shutdown(cancel_futures=True)
+    for executor in executors:
+        executor.shutdown(cancel_futures=True)
+
     signal.signal(sig, default_handler)
 
 
@@ -36,6 +61,9 @@ class TaskRunner:
         self,
         instance_id: int | None = None,
         config: Env | None = None,
+        pools: Dict[str, ExecutorPoolConfig] | None = None,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple[Any, ...] = (),
     ) -> None:
         if instance_id is None:
             instance_id = 0
@@ -49,34 +77,115 @@ class TaskRunner:
         self._cleanup_task: Optional[asyncio.Task] = None
         self._run_cleanup: bool = False
         self._snowflake_generator = SnowflakeGenerator(instance_id)
+        self._events = RunEventBus()
+        self._shell_buffer_size = config.MERCURY_SYNC_SHELL_BUFFER_SIZE
 
-        if config.MERCURY_SYNC_EXECUTOR_TYPE == "thread":
-            self._executor = ThreadPoolExecutor(
-                max_workers=config.MERCURY_SYNC_TASK_RUNNER_MAX_THREADS
+        self._process_semaphore: asyncio.Semaphore | None = None
+        if config.MERCURY_SYNC_MAX_SHELL_PROCESSES:
+            self._process_semaphore = asyncio.Semaphore(
+                value=config.MERCURY_SYNC_MAX_SHELL_PROCESSES
             )
 
-        else:
-            self._executor = ProcessPoolExecutor(
-                max_workers=config.MERCURY_SYNC_TASK_RUNNER_MAX_THREADS
-            )
+        self._kill_grace_period = TimeParser(
+            config.MERCURY_SYNC_SHELL_KILL_GRACE_PERIOD
+        ).time
+
+        self._session_pool = ShellSessionPool(
+            config.MERCURY_SYNC_SHELL_SESSIONS,
+            executable=config.MERCURY_SYNC_SHELL_SESSION_EXECUTABLE,
+            buffer_size=self._shell_buffer_size,
+        )
 
-        self._executor_sempahore = asyncio.Semaphore(
-            value=config.MERCURY_SYNC_TASK_RUNNER_MAX_THREADS
+        self._shell_cache = ShellCache(
+            config.MERCURY_SYNC_SHELL_CACHE_DIRECTORY,
+            max_size=config.MERCURY_SYNC_SHELL_CACHE_MAX_SIZE,
         )
+
+        self._spawn_limiter: TokenBucket | None = None
+        if config.MERCURY_SYNC_SHELL_SPAWN_RATE:
+            self._spawn_limiter = TokenBucket(
+                config.MERCURY_SYNC_SHELL_SPAWN_RATE,
+                capacity=config.MERCURY_SYNC_SHELL_SPAWN_BURST,
+            )
+
+        pool_configs: Dict[str, ExecutorPoolConfig] = {
+            "default": ExecutorPoolConfig(
+                type=config.MERCURY_SYNC_EXECUTOR_TYPE,
+                max_workers=config.MERCURY_SYNC_TASK_RUNNER_MAX_THREADS,
+                min_workers=config.MERCURY_SYNC_TASK_RUNNER_MIN_THREADS,
+                scaling=config.MERCURY_SYNC_EXECUTOR_SCALING,
+                idle_ttl=config.MERCURY_SYNC_EXECUTOR_IDLE_TTL,
+                preload=config.MERCURY_SYNC_EXECUTOR_PRELOAD,
+                initializer=initializer,
+                initargs=initargs,
+                warm_up=config.MERCURY_SYNC_EXECUTOR_WARMUP,
+                start_method=config.MERCURY_SYNC_EXECUTOR_START_METHOD,
+                forkserver_preload=config.MERCURY_SYNC_EXECUTOR_FORKSERVER_PRELOAD,
+                max_tasks_per_child=config.MERCURY_SYNC_EXECUTOR_MAX_TASKS_PER_CHILD,
+                max_rss=config.MERCURY_SYNC_EXECUTOR_MAX_WORKER_RSS,
+            ),
+            **config.MERCURY_SYNC_EXECUTOR_POOLS,
+        }
+
+        if pools:
+            pool_configs.update(pools)
+
+        ExecutorPool.set_forkserver_preload(pool_configs.values())
+
+        self._pools: Dict[str, ExecutorPool] = {
+            name: ExecutorPool(name, pool_config)
+            for name, pool_config in pool_configs.items()
+        }
+
+        self._executor = self._pools["default"].executor
+        self._executor_sempahore = self._pools["default"].semaphore
         self._loop = asyncio.get_event_loop()
 
+        self._warm_up_task: asyncio.Future | None = None
+        warm_pools = [name for name, pool in self._pools.items() if pool.config.warm_up]
+        if warm_pools:
+            self._warm_up_task = self._loop.create_task(self.warm_up(*warm_pools))
+
         for sig in [signal.SIGINT, signal.SIGTERM, signal.SIG_IGN]:
             default_handler = signal.getsignal(sig)
 
             self._loop.add_signal_handler(
                 sig,
-                lambda: shutdown_executor(
+                lambda sig=sig, default_handler=default_handler: self._handle_signal(
                     sig,
-                    self._executor,
                     default_handler,
                 ),
             )
 
+    def _handle_signal(self, sig: int, default_handler: Callable[..., Any]):
+        for task in self.tasks.values():
+            task.send_signal(sig)
+
+        self._session_pool.close()
+
+        shutdown_executor(
+            sig,
+            [pool.executor for pool in self._pools.values()],
+            default_handler,
+        )
+
+    @property
+    def pools(self):
+        return list(self._pools)
+
+    @property
+    def executor_size(self):
+        return self.pool_size()
+
+    def pool_size(self, pool: str = "default"):
+        return self._pools[pool].size
+
+    async def warm_up(self, *pools: str):
+        if not pools:
+            pools = tuple(self._pools)
+
+        await asyncio.gather(*[self._pools[pool].warm_up() for pool in pools])
+
     def all_tasks(self):
         for task in self.tasks.values():
             yield task
@@ -113,6 +222,7 @@ class TaskRunner:
         keep: int | None = None,
         max_age: str | None = None,
         keep_policy: Literal["COUNT", "AGE", "COUNT_AND_AGE"] = "COUNT",
+        pool: str = "default",
         **kwargs,
     ):
         if isinstance(timeout, str):
@@ -127,18 +237,21 @@ class TaskRunner:
 
         task = self.tasks.get(command_name)
         if task is None and call:
+            executor_pool = self._pools[pool]
+
             task = Task(
                 self._snowflake_generator,
                 command_name,
                 call,
-                self._executor,
-                self._executor_sempahore,
+                executor_pool.executor,
+                executor_pool.semaphore,
                 schedule=schedule,
                 trigger=trigger,
                 repeat=repeat,
                 keep=keep,
                 max_age=max_age,
                 keep_policy=keep_policy,
+                events=self._events,
             )
 
             self.tasks[command_name] = task
@@ -170,6 +283,19 @@ class TaskRunner:
         env: dict[str, Any] | None = None,
         cwd: str | None = None,
         shell: bool = False,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        stream_output: bool = False,
+        cache: bool = False,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
         run_id: int | None = None,
         timeout: str | int | float | None = None,
         schedule: str | None = None,
@@ -192,6 +318,75 @@ class TaskRunner:
         if shell:
             args = [shlex.quote(arg) for arg in args]
 
+        task = self._get_shell_task(
+            command_name,
+            command,
+            schedule=schedule,
+            trigger=trigger,
+            repeat=repeat,
+            keep=keep,
+            max_age=max_age,
+            keep_policy=keep_policy,
+        )
+
+        if task and task.repeat == "NEVER":
+            return task.run_shell(
+                *args,
+                env=env,
+                cwd=cwd,
+                shell=shell,
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+                spill_threshold=spill_threshold,
+                text=text,
+                encoding=encoding,
+                errors=errors,
+                max_output_bytes=max_output_bytes,
+                keep_output=keep_output,
+                session=session,
+                stream_output=stream_output,
+                cache=self._shell_cache if cache else None,
+                cache_inputs=cache_inputs,
+                run_id=run_id,
+                timeout=timeout,
+                poll_interval=self._cleanup_interval,
+            )
+
+        elif task and task.schedule:
+            return task.run_shell_schedule(
+                *args,
+                env=env,
+                cwd=cwd,
+                shell=shell,
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+                spill_threshold=spill_threshold,
+                text=text,
+                encoding=encoding,
+                errors=errors,
+                max_output_bytes=max_output_bytes,
+                keep_output=keep_output,
+                session=session,
+                stream_output=stream_output,
+                cache=self._shell_cache if cache else None,
+                cache_inputs=cache_inputs,
+                run_id=run_id,
+                timeout=timeout,
+            )
+
+    def _get_shell_task(
+        self,
+        command_name: str,
+        command: str,
+        schedule: str | None = None,
+        trigger: Literal["MANUAL", "ON_START"] = "MANUAL",
+        repeat: Literal["NEVER", "ALWAYS"] | int = "NEVER",
+        keep: int | None = None,
+        max_age: str | None = None,
+        keep_policy: Literal["COUNT", "AGE", "COUNT_AND_AGE"] = "COUNT",
+    ):
         task = self.tasks.get(command_name)
         if task is None:
             task = Task(
@@ -207,55 +402,270 @@ class TaskRunner:
                 max_age=max_age,
                 keep_policy=keep_policy,
                 task_type=TaskType.SHELL,
+                events=self._events,
+                buffer_size=self._shell_buffer_size,
+                process_semaphore=self._process_semaphore,
+                spawn_limiter=self._spawn_limiter,
+                kill_grace_period=self._kill_grace_period,
+                session_pool=self._session_pool,
             )
 
             self.tasks[command_name] = task
 
-        if task and task.repeat == "NEVER":
-            return task.run_shell(
-                *args,
-                env=env,
-                cwd=cwd,
-                shell=shell,
-                run_id=run_id,
-                timeout=timeout,
-                poll_interval=self._cleanup_interval,
+        return task
+
+    def pipeline(
+        self,
+        commands: Sequence[str | Sequence[str]],
+        alias: str | None = None,
+        env: dict[str, Any] | None = None,
+        cwd: str | None = None,
+        stdin: InputSource = None,
+        stdout: OutputTarget = None,
+        stderr: OutputTarget = None,
+        spill_threshold: int | None = None,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        timeout: str | int | float | None = None,
+    ) -> list[Run]:
+        if isinstance(timeout, str):
+            timeout = TimeParser(timeout).time
+
+        if self._cleanup_task is None:
+            self.start_cleanup()
+
+        runs: list[Run] = []
+        stage_stdin = stdin
+        last_stage = len(commands) - 1
+
+        for stage, stage_command in enumerate(commands):
+            if isinstance(stage_command, str):
+                command, args = stage_command, ()
+
+            else:
+                command, *args = stage_command
+
+            stage_stdout = stdout
+            next_stdin: InputSource = None
+            owned_files: list[io.IOBase] = []
+
+            if stage > 0:
+                owned_files.append(stage_stdin)
+
+            if stage < last_stage:
+                read_fd, write_fd = os.pipe()
+                stage_stdout = open(write_fd, "wb", buffering=0)
+                next_stdin = open(read_fd, "rb", buffering=0)
+                owned_files.append(stage_stdout)
+
+            stage_name = f"{alias}_{stage}" if alias else command
+            task = self._get_shell_task(stage_name, command)
+
+            runs.append(
+                task.run_shell(
+                    *args,
+                    env=env,
+                    cwd=cwd,
+                    stdin=stage_stdin,
+                    stdout=stage_stdout,
+                    stderr=stderr if stage == last_stage else None,
+                    spill_threshold=spill_threshold,
+                    text=text,
+                    encoding=encoding,
+                    errors=errors,
+                    max_output_bytes=max_output_bytes,
+                    keep_output=keep_output,
+                    process_limit=False,
+                    owned_files=owned_files,
+                    timeout=timeout,
+                    poll_interval=self._cleanup_interval,
+                )
             )
 
-        elif task and task.schedule:
-            return task.run_shell_schedule(
+            stage_stdin = next_stdin
+
+        return runs
+
+    async def command_map(
+        self,
+        command: str,
+        arg_lists: Iterable[Sequence[str]],
+        max_parallel: int | None = None,
+        alias: str | None = None,
+        env: dict[str, Any] | None = None,
+        cwd: str | None = None,
+        shell: bool = False,
+        text: bool = True,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_output_bytes: int | None = None,
+        keep_output: OutputRetention = "tail",
+        session: bool = False,
+        cache: bool = False,
+        cache_inputs: Sequence[str | pathlib.Path] | None = None,
+        timeout: str | int | float | None = None,
+    ) -> AsyncIterator[ShellProcess]:
+        if max_parallel is None:
+            max_parallel = os.cpu_count() or 1
+
+        args_iter = iter(arg_lists)
+        pending: dict[asyncio.Future, Run] = {}
+
+        def launch(args: Sequence[str]):
+            run = self.command(
+                command,
                 *args,
+                alias=alias,
                 env=env,
                 cwd=cwd,
                 shell=shell,
-                run_id=run_id,
+                text=text,
+                encoding=encoding,
+                errors=errors,
+                max_output_bytes=max_output_bytes,
+                keep_output=keep_output,
+                session=session,
+                cache=cache,
+                cache_inputs=cache_inputs,
                 timeout=timeout,
             )
 
+            pending[asyncio.ensure_future(run.wait())] = run
+
+        for args in itertools.islice(args_iter, max_parallel):
+            launch(args)
+
+        try:
+            while pending:
+                completed, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for waiter in completed:
+                    run = pending.pop(waiter)
+                    self.tasks[run.task_name].discard(run.run_id)
+
+                for args in itertools.islice(args_iter, len(completed)):
+                    launch(args)
+
+                for waiter in completed:
+                    yield waiter.result()
+
+        finally:
+            for waiter in pending:
+                waiter.cancel()
+
+            await asyncio.gather(
+                *[run.cancel() for run in pending.values()],
+                return_exceptions=True,
+            )
+
+            for run in pending.values():
+                self.tasks[run.task_name].discard(run.run_id)
+
     async def wait_all(self, tokens: list[str]):
         return await asyncio.gather(
             *[self.wait(token) for token in tokens],
         )
 
+    async def as_completed(
+        self,
+        tokens: Iterable[str],
+        window: int | None = None,
+    ) -> AsyncIterator[ShellProcess | TaskRun]:
+        tokens_iter = iter(tokens)
+
+        pending: set[asyncio.Future] = set(
+            asyncio.ensure_future(self.wait(token))
+            for token in itertools.islice(tokens_iter, window)
+        )
+
+        try:
+            while pending:
+                completed, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for token in itertools.islice(tokens_iter, len(completed)):
+                    pending.add(asyncio.ensure_future(self.wait(token)))
+
+                for waiter in completed:
+                    yield waiter.result()
+
+        finally:
+            for waiter in pending:
+                waiter.cancel()
+
     async def wait(self, token: str) -> ShellProcess | TaskRun:
-        task_name, run_id_str = token.split(":", maxsplit=1)
-        run_id = int(run_id_str)
-
-        update = await self.tasks[task_name].get_run_update(run_id)
-        while update.status not in [
-            RunStatus.COMPLETE,
-            RunStatus.FAILED,
-            RunStatus.CANCELLED,
-        ]:
-            await asyncio.sleep(self._cleanup_interval)
-            update = await self.tasks[task_name].get_run_update(run_id)
+        task_name, run_id = token.split(":", maxsplit=1)
+
+        return await self.tasks[task_name].wait(int(run_id))
+
+    async def subscribe(
+        self,
+        task_name: str | None = None,
+        statuses: Iterable[RunStatus | RunStatusName] | None = None,
+    ) -> AsyncIterator[RunEvent]:
+        subscription = self._events.subscribe(
+            task_name=task_name,
+            statuses=statuses,
+        )
+
+        try:
+            while True:
+                yield await subscription.get()
+
+        finally:
+            self._events.unsubscribe(subscription.subscription_id)
+
+    def add_listener(
+        self,
+        callback: RunEventCallback,
+        task_name: str | None = None,
+        statuses: Iterable[RunStatus | RunStatusName] | None = None,
+    ) -> int:
+        subscription = self._events.subscribe(
+            task_name=task_name,
+            statuses=statuses,
+            callback=callback,
+        )
+
+        return subscription.subscription_id
 
-        return await self.tasks[task_name].complete(run_id)
+    def remove_listener(self, subscription_id: int):
+        self._events.unsubscribe(subscription_id)
 
-    async def get_task_update(self, token: str):
+    async def stream(
+        self,
+        token: str,
+        output: Literal["stdout", "stderr"] = "stdout",
+        lines: bool = True,
+        since: int = 0,
+    ) -> AsyncIterator[str | bytes]:
+        task_name, run_id = token.split(":", maxsplit=1)
+
+        async for chunk in self.tasks[task_name].stream(
+            int(run_id),
+            output=output,
+            lines=lines,
+            since=since,
+        ):
+            yield chunk
+
+    async def get_task_update(
+        self,
+        token: str,
+        since: OutputCursor | None = None,
+    ):
         task_name, run_id = token.split(":", maxsplit=1)
         return await self.tasks[task_name].get_run_update(
             int(run_id),
+            since=since,
         )
 
     def stop_schedules(
@@ -316,11 +726,10 @@ class TaskRunner:
         except Exception:
             pass
 
-        try:
-            self._executor.shutdown(cancel_futures=True)
+        for executor_pool in self._pools.values():
+            executor_pool.shutdown()
 
-        except Exception:
-            pass
+        self._session_pool.close()
 
     def abort(self):
         for task in self.tasks.values():
@@ -334,11 +743,10 @@ class TaskRunner:
         except Exception:
             pass
 
-        try:
-            self._executor.shutdown(cancel_futures=True)
+        for executor_pool in self._pools.values():
+            executor_pool.shutdown()
 
-        except Exception:
-            pass
+        self._session_pool.close()
 
     async def _cleanup(self):
         while self._run_cleanup:
@@ -1 +1,2 @@
-from .time_parser import TimeParser as TimeParser
\ No newline at end of file
+from .time_parser import TimeParser as TimeParser
+from .token_bucket import TokenBucket as TokenBucket
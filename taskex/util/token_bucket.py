@@ -0,0 +1,37 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: int | float,
+        capacity: int | None = None,
+    ) -> None:
+        if capacity is None:
+            capacity = max(1, int(rate))
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens: float = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+
+            self._tokens -= 1
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate,
+        )
+
+        self._updated = now